@@ -70,6 +70,13 @@ options:
       ports first. This is a destructive override.
     type: bool
     default: false
+  batch_commands:
+    description: >
+      Coalesce switch writes that carry the same payload (for example several
+      ports moving to the same access VLAN) into a single CGI request instead
+      of one request per port. Disable to fall back to per-port writes.
+    type: bool
+    default: true
   vlans:
     description: >
       Incremental VLAN changes, keyed by VLAN ID (string or int).
@@ -213,25 +220,26 @@ warnings:
 
 from ansible.module_utils.basic import AnsibleModule  # noqa: E402  # type: ignore[import-untyped]
 
+# Built once at import rather than on every main() call.
+_ARG_SPEC: dict[str, dict[str, object]] = dict(
+    host=dict(type="str", required=True),
+    username=dict(type="str", required=True),
+    password=dict(type="str", required=True, no_log=True),
+    port=dict(type="int"),
+    verify_tls=dict(type="bool", default=False),
+    backup_before_change=dict(type="bool", default=True),
+    safety_port_id=dict(type="int", default=6),
+    allow_port_mode_change=dict(type="bool", default=False),
+    allow_untagged_move=dict(type="bool", default=False),
+    allow_vlan_delete_in_use=dict(type="bool", default=False),
+    batch_commands=dict(type="bool", default=True),
+    vlans=dict(type="dict"),
+    ports=dict(type="dict"),
+)
+
 
 def main() -> None:
-    module = AnsibleModule(
-        argument_spec=dict(
-            host=dict(type="str", required=True),
-            username=dict(type="str", required=True),
-            password=dict(type="str", required=True, no_log=True),
-            port=dict(type="int"),
-            verify_tls=dict(type="bool", default=False),
-            backup_before_change=dict(type="bool", default=True),
-            safety_port_id=dict(type="int", default=6),
-            allow_port_mode_change=dict(type="bool", default=False),
-            allow_untagged_move=dict(type="bool", default=False),
-            allow_vlan_delete_in_use=dict(type="bool", default=False),
-            vlans=dict(type="dict"),
-            ports=dict(type="dict"),
-        ),
-        supports_check_mode=True,
-    )
+    module = AnsibleModule(argument_spec=_ARG_SPEC, supports_check_mode=True)
     # Execution is handled entirely by action_plugins/jtcom_config.py.
     # This stub is reached only when the action plugin is absent.
     module.fail_json(msg="jtcom_config action plugin not found. Check action_plugins path.")
@@ -28,13 +28,12 @@ from __future__ import annotations
 import os
 import pprint
 
+from napalm_jtcom.config import Settings
 from napalm_jtcom.driver import JTComDriver
 from napalm_jtcom.model.config import DeviceConfig
 from napalm_jtcom.model.vlan import VlanConfig
 
-HOST = os.getenv("JTCOM_HOST", "192.0.2.1")
-USERNAME = os.getenv("JTCOM_USERNAME", "admin")
-PASSWORD = os.getenv("JTCOM_PASSWORD", "admin")
+SETTINGS = Settings.from_env(host="192.0.2.1", username="admin", password="admin")
 APPLY = os.getenv("APPLY", "0") == "1"
 
 # ---------------------------------------------------------------------------
@@ -54,11 +53,8 @@ desired = DeviceConfig(
 # Connect and apply (or dry-run)
 # ---------------------------------------------------------------------------
 driver = JTComDriver(
-    hostname=HOST,
-    username=USERNAME,
-    password=PASSWORD,
     timeout=10,
-    optional_args={"safety_port_id": 6, "backup_before_change": True},
+    **SETTINGS.driver_kwargs(safety_port_id=6, backup_before_change=True),
 )
 
 driver.open()
@@ -30,7 +30,7 @@ from __future__ import annotations
 import os
 import sys
 
-from napalm_jtcom.driver import JTComDriver
+from napalm_jtcom.config import Settings
 from napalm_jtcom.model.vlan import VlanConfig
 
 # ---------------------------------------------------------------------------
@@ -44,32 +44,29 @@ DESIRED_VLANS: dict[int, VlanConfig] = {
 # ---------------------------------------------------------------------------
 # Read configuration from environment
 # ---------------------------------------------------------------------------
-host = os.environ.get("JTCOM_HOST", "")
-if not host:
-    print("ERROR: JTCOM_HOST environment variable is required.", file=sys.stderr)
+try:
+    settings = Settings.from_env(username="admin", password="admin")
+except ValueError as exc:
+    print(f"ERROR: {exc}.", file=sys.stderr)
     sys.exit(1)
 
-username = os.environ.get("JTCOM_USERNAME", "admin")
-password = os.environ.get("JTCOM_PASSWORD", "admin")
-verify_tls = os.environ.get("JTCOM_VERIFY_TLS", "false").lower() == "true"
 apply_changes = os.environ.get("APPLY", "0") == "1"
 
+# Import here so import errors surface after env var check.
+from napalm_jtcom.driver import JTComDriver  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Driver setup and apply
 # ---------------------------------------------------------------------------
-print(f"Target switch : {host}")
+print(f"Target switch : {settings.host}")
 print(f"Apply changes : {apply_changes}")
 print()
 
 driver = JTComDriver(
-    hostname=host,
-    username=username,
-    password=password,
-    optional_args={
-        "verify_tls": verify_tls,
-        "backup_before_change": apply_changes,  # only backup when really applying
-        "backup_dir": "./backups",
-    },
+    **settings.driver_kwargs(
+        backup_before_change=apply_changes,  # only backup when really applying
+        backup_dir="./backups",
+    )
 )
 
 try:
@@ -17,34 +17,22 @@ Exit codes:
 from __future__ import annotations
 
 import json
-import os
 import sys
 
-
-def _env(name: str, default: str | None = None) -> str:
-    value = os.environ.get(name, default)
-    if value is None:
-        print(f"ERROR: required environment variable {name!r} is not set.", file=sys.stderr)
-        sys.exit(1)
-    return value
+from napalm_jtcom.config import Settings
 
 
 def main() -> None:
-    host = _env("JTCOM_HOST")
-    username = _env("JTCOM_USERNAME")
-    password = _env("JTCOM_PASSWORD")
-    verify_tls_raw = os.environ.get("JTCOM_VERIFY_TLS", "false").lower()
-    verify_tls = verify_tls_raw not in {"0", "false", "no", "off"}
+    try:
+        settings = Settings.from_env()
+    except ValueError as exc:
+        print(f"ERROR: {exc}.", file=sys.stderr)
+        sys.exit(1)
 
     # Import here so import errors surface after env var check.
     from napalm_jtcom.driver import JTComDriver
 
-    driver = JTComDriver(
-        hostname=host,
-        username=username,
-        password=password,
-        optional_args={"verify_tls": verify_tls},
-    )
+    driver = JTComDriver(**settings.driver_kwargs())
 
     try:
         driver.open()
@@ -12,33 +12,22 @@ JTCOM_VERIFY_TLS  Set to "true" to verify TLS (default: false)
 from __future__ import annotations
 
 import json
-import os
 import sys
 
-from napalm_jtcom.driver import JTComDriver
-
-
-def _require(name: str) -> str:
-    print(f"ERROR: required environment variable {name!r} is not set.", file=sys.stderr)
-    sys.exit(1)
+from napalm_jtcom.config import Settings
 
 
 def main() -> None:
-    host = os.environ.get("JTCOM_HOST", "")
-    if not host:
-        print("ERROR: JTCOM_HOST is not set.", file=sys.stderr)
+    try:
+        settings = Settings.from_env()
+    except ValueError as exc:
+        print(f"ERROR: {exc}.", file=sys.stderr)
         sys.exit(1)
 
-    username = os.environ.get("JTCOM_USERNAME") or _require("JTCOM_USERNAME")
-    password = os.environ.get("JTCOM_PASSWORD") or _require("JTCOM_PASSWORD")
-    verify_tls = os.environ.get("JTCOM_VERIFY_TLS", "false").lower() == "true"
+    # Import here so import errors surface after env var check.
+    from napalm_jtcom.driver import JTComDriver
 
-    driver = JTComDriver(
-        hostname=host,
-        username=username,
-        password=password,
-        optional_args={"verify_tls": verify_tls},
-    )
+    driver = JTComDriver(**settings.driver_kwargs())
     try:
         driver.open()
         interfaces = driver.get_interfaces()
@@ -16,7 +16,7 @@ Environment variables:
     JTCOM_HOST        Switch IP or hostname (required).
     JTCOM_USERNAME    Login username (default: admin).
     JTCOM_PASSWORD    Login password (default: admin).
-    JTCOM_VERIFY_TLS  Set to "1" to verify TLS certificates (default: off).
+    JTCOM_VERIFY_TLS  Set to "1"/"true" to verify TLS certificates (default: off).
     TEST_PORT_ID      1-based port number to toggle (required).
     APPLY             Set to "1" to actually apply changes (default: dry-run).
 
@@ -29,18 +29,14 @@ import os
 import sys
 import time
 
-from napalm_jtcom.client.port_ops import apply_port_changes
-from napalm_jtcom.client.session import JTComCredentials, JTComSession
-from napalm_jtcom.model.port import PortConfig
-from napalm_jtcom.parser.port import parse_port_page
-from napalm_jtcom.utils.port_diff import plan_port_changes
-from napalm_jtcom.vendor.jtcom.endpoints import PORT_SETTINGS
+from napalm_jtcom.config import Settings
 
 
 def main() -> None:
-    host = os.environ.get("JTCOM_HOST", "")
-    if not host:
-        print("ERROR: JTCOM_HOST environment variable is required.", file=sys.stderr)
+    try:
+        settings = Settings.from_env(username="admin", password="admin")
+    except ValueError as exc:
+        print(f"ERROR: {exc}.", file=sys.stderr)
         sys.exit(1)
 
     port_id_str = os.environ.get("TEST_PORT_ID", "")
@@ -55,14 +51,22 @@ def main() -> None:
         print(f"ERROR: TEST_PORT_ID must be an integer, got {port_id_str!r}", file=sys.stderr)
         sys.exit(1)
 
-    username = os.environ.get("JTCOM_USERNAME", "admin")
-    password = os.environ.get("JTCOM_PASSWORD", "admin")
-    verify_tls = os.environ.get("JTCOM_VERIFY_TLS", "0") == "1"
     apply_changes = os.environ.get("APPLY", "0") == "1"
 
+    # Import here so import errors surface after env var check.
+    from napalm_jtcom.client.port_ops import apply_port_changes
+    from napalm_jtcom.client.session import JTComCredentials, JTComSession
+    from napalm_jtcom.model.port import PortConfig
+    from napalm_jtcom.parser.port import parse_port_page
+    from napalm_jtcom.utils.port_diff import plan_port_changes
+    from napalm_jtcom.vendor.jtcom.endpoints import PORT_SETTINGS
+
+    host = settings.host
     base_url = host if "://" in host else f"http://{host}"
-    creds = JTComCredentials(username=username, password=password)
-    session = JTComSession(base_url=base_url, credentials=creds, verify_tls=verify_tls)
+    creds = JTComCredentials(username=settings.username, password=settings.password)
+    session = JTComSession(
+        base_url=base_url, credentials=creds, verify_tls=settings.verify_tls
+    )
     session.login()
 
     try:
@@ -8,10 +8,13 @@ imported directly with no subprocess or bootstrap tricks required.
 """
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from typing import Any
 
 from ansible.plugins.action import ActionBase
 
+_REQUIRED: tuple[str, ...] = ("host", "username", "password")
+
 
 class ActionModule(ActionBase):  # type: ignore[misc]
     """Idempotent configuration of JTCom CGI switches via napalm_jtcom."""
@@ -26,22 +29,20 @@ class ActionModule(ActionBase):  # type: ignore[misc]
         result: dict[str, Any] = super().run(tmp, task_vars)
         p: dict[str, Any] = self._task.args
 
-        for key in ("host", "username", "password"):
-            if not p.get(key):
-                return dict(failed=True, msg=f"Parameter '{key}' is required.")
+        missing = [key for key in _REQUIRED if not p.get(key)]
+        if missing:
+            return {"failed": True, "msg": f"Missing required parameters: {', '.join(missing)}."}
 
         try:
             from napalm_jtcom.client.errors import JTComError
-            from napalm_jtcom.driver import JTComDriver
             from napalm_jtcom.model.config import DeviceConfig
             from napalm_jtcom.model.port import PortConfig
             from napalm_jtcom.model.vlan import VlanConfig
         except ImportError as exc:
-            return dict(failed=True, msg=f"napalm_jtcom is not installed: {exc}")
+            return {"failed": True, "msg": f"napalm_jtcom is not installed: {exc}"}
 
         vlans: dict[int, Any] = {}
-        for key, entry in (p.get("vlans") or {}).items():
-            vid = int(key)
+        for vid, entry in _int_keyed(p.get("vlans")):
             entry = entry or {}
             vlans[vid] = VlanConfig(
                 vlan_id=vid,
@@ -58,8 +59,7 @@ class ActionModule(ActionBase):  # type: ignore[misc]
             )
 
         ports: dict[int, Any] = {}
-        for key, entry in (p.get("ports") or {}).items():
-            pid = int(key)
+        for pid, entry in _int_keyed(p.get("ports")):
             entry = entry or {}
             ports[pid] = PortConfig(
                 port_id=pid,
@@ -81,10 +81,17 @@ class ActionModule(ActionBase):  # type: ignore[misc]
             "safety_port_id": 6,
             "allow_port_mode_change": p.get("allow_port_mode_change", False),
             "allow_untagged_move": p.get("allow_untagged_move", False),
+            "batch_commands": p.get("batch_commands", True),
         }
         if "allow_vlan_delete_in_use" in p:
             optional_args["allow_vlan_delete_in_use"] = p.get("allow_vlan_delete_in_use")
 
+        # The driver (and napalm behind it) is only needed from here on.
+        try:
+            from napalm_jtcom.driver import JTComDriver
+        except ImportError as exc:
+            return {"failed": True, "msg": f"napalm_jtcom is not installed: {exc}"}
+
         try:
             driver = JTComDriver(
                 hostname=p["host"],
@@ -101,7 +108,7 @@ class ActionModule(ActionBase):  # type: ignore[misc]
             finally:
                 driver.close()
         except (JTComError, ValueError, ConnectionError) as exc:
-            return dict(failed=True, msg=str(exc))
+            return {"failed": True, "msg": str(exc)}
 
         result.update(
             changed=cfg_result["changed"],
@@ -115,13 +122,23 @@ class ActionModule(ActionBase):  # type: ignore[misc]
         return result
 
 
-def _int_list_or_none(entry: dict[str, Any], key: str) -> list[int] | None:
+def _int_keyed(section: dict[Any, Any] | None) -> Iterator[tuple[int, Any]]:
+    """Yield ``(int(key), entry)`` pairs from a vlans/ports parameter dict.
+
+    YAML integer keys arrive as ``int`` already and skip the conversion; the
+    exact type check keeps ``bool`` keys on the ``int()`` path.
+    """
+    for key, entry in (section or {}).items():
+        yield (key if type(key) is int else int(key)), entry
+
+
+def _int_list_or_none(entry: Mapping[str, Any], key: str) -> list[int] | None:
     if key not in entry or entry[key] is None:
         return None
-    return [int(x) for x in entry[key]]
+    return list(map(int, entry[key]))
 
 
-def _int_or_none(entry: dict[str, Any], key: str) -> int | None:
+def _int_or_none(entry: Mapping[str, Any], key: str) -> int | None:
     if key not in entry or entry[key] is None:
         return None
     return int(entry[key])
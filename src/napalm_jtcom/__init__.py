@@ -1,6 +1,26 @@
 """NAPALM community driver for JTCom CGI-based Ethernet switches."""
 
-from napalm_jtcom.driver import JTComDriver
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from napalm_jtcom.driver import JTComDriver
 
 __all__ = ["JTComDriver"]
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> type[JTComDriver]:
+    # The driver pulls in napalm and its dependency tree; load it on first
+    # access so importing only the models or the client stays cheap.
+    if name == "JTComDriver":
+        from napalm_jtcom.driver import JTComDriver
+
+        return JTComDriver
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    # napalm.get_network_driver() discovers the driver class via dir().
+    return sorted({*globals(), "JTComDriver"})
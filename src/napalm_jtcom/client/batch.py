@@ -0,0 +1,52 @@
+"""Dispatch several independent CGI writes to one endpoint."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from napalm_jtcom.client.http import POOL_MAXSIZE
+from napalm_jtcom.client.session import FormFields, JTComSession
+
+logger = logging.getLogger(__name__)
+
+
+def submit_batch(
+    session: JTComSession,
+    endpoint: str,
+    forms: Sequence[FormFields],
+    max_parallel: int = 1,
+) -> list[dict[str, object]]:
+    """POST every form in *forms* to *endpoint*.
+
+    With ``max_parallel <= 1`` the forms are sent one after another.
+    Otherwise up to *max_parallel* requests are in flight at once over the
+    session's shared connection pool; callers must only batch writes that do
+    not depend on each other's order.  Concurrency is capped at
+    :data:`~napalm_jtcom.client.http.POOL_MAXSIZE` so every worker keeps a
+    pooled keep-alive connection instead of opening throwaway ones.
+
+    Args:
+        session: Active authenticated session.
+        endpoint: CGI path every form is posted to.
+        forms: Form payloads, as accepted by :meth:`.JTComSession.post`.
+        max_parallel: Maximum number of concurrent requests.
+
+    Returns:
+        The parsed JSON responses, in the order of *forms*.
+
+    Raises:
+        JTComSwitchError: The first failure (in *forms* order), after every
+            request has finished.
+    """
+    if max_parallel <= 1 or len(forms) <= 1:
+        return [session.post(endpoint, data=form) for form in forms]
+
+    # Log in up front so worker threads do not race to authenticate.
+    session.ensure_session()
+    workers = min(max_parallel, len(forms), POOL_MAXSIZE)
+    logger.debug("Posting %d forms to %s with %d workers", len(forms), endpoint, workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jtcom-batch") as pool:
+        futures = [pool.submit(session.post, endpoint, form) for form in forms]
+    return [future.result() for future in futures]
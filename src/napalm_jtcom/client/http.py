@@ -6,6 +6,8 @@ import importlib.metadata
 import logging
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from napalm_jtcom.client.errors import JTComRequestError, JTComResponseError
 
@@ -18,6 +20,23 @@ except importlib.metadata.PackageNotFoundError:
 
 _USER_AGENT: str = f"napalm-jtcom/{_VERSION}"
 
+# Connection pool sizing for sessions created by JTComHTTP itself.  With
+# requests>=2.32 every verified HTTPS pool shares one preloaded SSLContext,
+# so reconnects do not reload the CA bundle; reuse of the TLS connection
+# itself comes from keep-alive and the ``http_session``/session pool hooks.
+_POOL_CONNECTIONS: int = 4
+# Public: concurrent callers size their worker pools to fit within it.
+POOL_MAXSIZE: int = 16
+# Transient gateway errors and connection failures are retried with
+# exponential backoff (0.3 s, 0.6 s, 1.2 s).  urllib3's default
+# allowed_methods excludes POST, so CGI writes are never replayed after the
+# request has been sent.  Read and status retries get a smaller budget than
+# connection failures, which never reached the switch.
+RETRY_TOTAL: int = 3
+_RETRY_READ_STATUS: int = 2
+_RETRY_BACKOFF_S: float = 0.3
+_RETRY_STATUS: frozenset[int] = frozenset({429, 502, 503, 504})
+
 
 def _normalise_base_url(url: str) -> str:
     """Ensure the URL has a scheme and no trailing slash."""
@@ -27,6 +46,29 @@ def _normalise_base_url(url: str) -> str:
     return url
 
 
+def _new_session(max_retries: int) -> requests.Session:
+    """Return a :class:`requests.Session` with a pooled, retrying adapter."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=False,
+        max_retries=Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=min(max_retries, _RETRY_READ_STATUS),
+            status=min(max_retries, _RETRY_READ_STATUS),
+            backoff_factor=_RETRY_BACKOFF_S,
+            status_forcelist=_RETRY_STATUS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class JTComHTTP:
     """Low-level HTTP wrapper around :class:`requests.Session`.
 
@@ -37,6 +79,14 @@ class JTComHTTP:
         base_url: Switch base URL, e.g. ``http://192.168.1.1``.
         timeout_s: Request timeout in seconds (default 30).
         verify_tls: Whether to verify TLS certificates (default True).
+        session: Optional pre-built :class:`requests.Session` to send requests
+            through, so its kept-alive connections can be shared between
+            clients.  An injected session is not closed by :meth:`close`
+            and keeps its own adapters; otherwise a new session is created
+            with a keep-alive connection pool and retries for transient
+            connection and gateway failures.
+        max_retries: Retry budget for that connection pool (default 3;
+            ``0`` disables retries).  Ignored for an injected *session*.
     """
 
     def __init__(
@@ -44,12 +94,19 @@ class JTComHTTP:
         base_url: str,
         timeout_s: float = 30.0,
         verify_tls: bool = True,
+        session: requests.Session | None = None,
+        max_retries: int = RETRY_TOTAL,
     ) -> None:
         self.base_url: str = _normalise_base_url(base_url)
         self.timeout_s: float = timeout_s
         self.verify_tls: bool = verify_tls
-        self._session: requests.Session = requests.Session()
+        self._owns_session: bool = session is None
+        self._session: requests.Session = (
+            session if session is not None else _new_session(max_retries)
+        )
         self._session.headers.update({"User-Agent": _USER_AGENT})
+        # Absolute URLs per CGI path; a driver cycles through a handful.
+        self._urls: dict[str, str] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -59,12 +116,16 @@ class JTComHTTP:
         self,
         path: str,
         params: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
     ) -> requests.Response:
         """Send an HTTP GET to *path* and return the response.
 
         Args:
             path: URL path relative to :attr:`base_url`.
             params: Optional query-string parameters.
+            stream: Defer reading the body; the caller must consume or
+                close the response.
 
         Returns:
             The :class:`requests.Response`.
@@ -73,17 +134,24 @@ class JTComHTTP:
             JTComRequestError: On any transport-level failure.
             JTComResponseError: On a non-2xx HTTP status code.
         """
-        url = self.base_url + path
+        url = self._url(path)
         try:
             resp = self._session.get(
                 url,
                 params=params,
                 timeout=self.timeout_s,
                 verify=self.verify_tls,
+                stream=stream,
             )
         except requests.exceptions.RequestException as exc:
             raise JTComRequestError(url, exc) from exc
-        self._raise_for_status(resp)
+        try:
+            self._raise_for_status(resp)
+        except JTComResponseError:
+            if stream:
+                # An unread streamed body would keep the pooled connection.
+                resp.close()
+            raise
         return resp
 
     def post_form(
@@ -106,7 +174,7 @@ class JTComHTTP:
             JTComRequestError: On any transport-level failure.
             JTComResponseError: On a non-2xx HTTP status code.
         """
-        url = self.base_url + path
+        url = self._url(path)
         try:
             resp = self._session.post(
                 url,
@@ -120,8 +188,9 @@ class JTComHTTP:
         return resp
 
     def close(self) -> None:
-        """Close the underlying :class:`requests.Session`."""
-        self._session.close()
+        """Close the underlying :class:`requests.Session` unless it was injected."""
+        if self._owns_session:
+            self._session.close()
 
     def __enter__(self) -> JTComHTTP:
         return self
@@ -133,6 +202,12 @@ class JTComHTTP:
     # Internals
     # ------------------------------------------------------------------
 
+    def _url(self, path: str) -> str:
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = self.base_url + path
+        return url
+
     @staticmethod
     def _raise_for_status(resp: requests.Response) -> None:
         if not resp.ok:
@@ -0,0 +1,200 @@
+"""Process-wide pool of authenticated JTCom sessions."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from napalm_jtcom.client.errors import JTComError
+from napalm_jtcom.client.session import JTComSession
+
+logger = logging.getLogger(__name__)
+
+# Set to "1" to let JTComDriver reuse logged-in sessions across instances.
+POOL_ENABLED_ENV: str = "JTCOM_POOL_ENABLED"
+# Idle sessions are logged out after this many seconds without use.
+CONNECTION_POOL_IDLE_TIMEOUT: float = 60.0
+# Sessions are logged out after this many seconds regardless of use.
+CONNECTION_POOL_MAX_AGE: float = 600.0
+
+
+def pool_enabled() -> bool:
+    """Return ``True`` when session pooling is enabled via the environment."""
+    return os.environ.get(POOL_ENABLED_ENV, "0") == "1"
+
+
+@dataclass
+class _PoolEntry:
+    session: JTComSession
+    created: float
+    last_used: float
+    in_use: bool = True
+
+
+class SessionPool:
+    """Cache of logged-in :class:`.JTComSession` objects keyed by target.
+
+    One idle session is kept per key.  A session is handed to a single
+    caller at a time; concurrent acquirers of a busy key get a fresh,
+    unpooled session that is closed on release.  Expired entries are closed
+    on every :meth:`acquire` and by a daemon janitor thread started on first
+    use.  A pooled session that fails its *validate* check on reuse is
+    closed and replaced by a fresh one, once.
+
+    Args:
+        idle_timeout: Seconds an idle session may stay pooled.
+        max_age: Seconds after login a session is retired.
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = CONNECTION_POOL_IDLE_TIMEOUT,
+        max_age: float = CONNECTION_POOL_MAX_AGE,
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._entries: dict[Hashable, _PoolEntry] = {}
+        self._janitor: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def acquire(
+        self,
+        key: Hashable,
+        factory: Callable[[], JTComSession],
+        validate: Callable[[JTComSession], None] | None = None,
+    ) -> JTComSession:
+        """Return a logged-in session for *key*, creating one if needed.
+
+        Args:
+            key: Identity of the target: every option the session was built
+                with, since a pooled session is handed out as-is.
+            factory: Callable returning a new, already logged-in session.
+            validate: Called with a pooled session before it is reused; a
+                :exc:`.JTComError` (e.g. the switch expired the login) evicts
+                it and a fresh session is built instead.
+
+        Returns:
+            A session reserved for the caller until :meth:`release`.
+        """
+        self._start_janitor()
+        self.prune()
+        reused: JTComSession | None = None
+        stale: JTComSession | None = None
+        with self._lock:
+            entry = self._entries.get(key)
+            busy = entry is not None and entry.in_use
+            if entry is not None and not busy:
+                if entry.session.logged_in:
+                    entry.in_use = True
+                    entry.last_used = time.monotonic()
+                    reused = entry.session
+                else:
+                    stale = self._entries.pop(key).session
+        if stale is not None:
+            stale.close()
+        if reused is not None:
+            try:
+                if validate is not None:
+                    validate(reused)
+            except JTComError:
+                logger.debug("Pooled session for %r is no longer valid", key, exc_info=True)
+                self.evict(key)
+            else:
+                logger.debug("Reusing pooled session for %r", key)
+                return reused
+        session = factory()
+        if not busy:
+            now = time.monotonic()
+            with self._lock:
+                self._entries.setdefault(key, _PoolEntry(session, now, now))
+        return session
+
+    def release(self, key: Hashable, session: JTComSession) -> None:
+        """Return *session* to the pool, or close it if it is not pooled.
+
+        Args:
+            key: The key passed to :meth:`acquire`.
+            session: The session :meth:`acquire` returned.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.session is session:
+                entry.in_use = False
+                entry.last_used = time.monotonic()
+                return
+        session.close()
+
+    def evict(self, key: Hashable) -> None:
+        """Drop and close the pooled session for *key*, if any."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry.session.close()
+
+    def prune(self) -> int:
+        """Close idle sessions past their idle timeout or maximum age.
+
+        Returns:
+            The number of sessions closed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if not entry.in_use
+                and (
+                    now - entry.last_used > self.idle_timeout
+                    or now - entry.created > self.max_age
+                )
+            ]
+            sessions = [self._entries.pop(key).session for key in expired]
+        for session in sessions:
+            session.close()
+        return len(sessions)
+
+    def close_all(self) -> None:
+        """Stop the janitor and close every pooled session."""
+        self._stop.set()
+        with self._lock:
+            sessions = [entry.session for entry in self._entries.values()]
+            self._entries.clear()
+        for session in sessions:
+            session.close()
+
+    def _start_janitor(self) -> None:
+        with self._lock:
+            if self._janitor is not None:
+                return
+            self._janitor = threading.Thread(
+                target=self._run_janitor, name="jtcom-pool-janitor", daemon=True
+            )
+            self._janitor.start()
+
+    def _run_janitor(self) -> None:
+        interval = max(1.0, min(self.idle_timeout, self.max_age) / 2)
+        while not self._stop.wait(interval):
+            try:
+                self.prune()
+            except Exception:  # noqa: BLE001
+                logger.debug("Session pool prune failed (ignored)", exc_info=True)
+
+
+_default_pool: SessionPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def default_pool() -> SessionPool:
+    """Return the process-wide :class:`SessionPool`, creating it on first use."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SessionPool()
+            atexit.register(_default_pool.close_all)
+        return _default_pool
@@ -48,18 +48,22 @@ SPEED_TOKEN_TO_CODE: dict[str, str] = {
     "2500M/Full": "6",
     "10G/Full": "7",
 }
+_VALID_SPEED_TOKENS: tuple[str, ...] = tuple(sorted(SPEED_TOKEN_TO_CODE))
 
 
 def apply_port_changes(
     session: JTComSession,
     current_settings: list[PortSettings],
     change_set: PortChangeSet,
+    batch: bool = True,
 ) -> None:
     """Apply port configuration changes to the switch.
 
     For each port in *change_set.update*, merges the desired change with the
-    current settings (filling in ``None`` fields) and issues a single POST to
-    ``port.cgi``.  Ports are processed in ascending ``port_id`` order.
+    current settings (filling in ``None`` fields).  Ports that resolve to the
+    same ``state``/``speed_duplex``/``flow`` are written with one POST to
+    ``port.cgi`` carrying a repeated ``portid`` field for each of them.
+    Groups are sent in order of their first port in *change_set.update*.
 
     Args:
         session: Active authenticated session.
@@ -67,6 +71,7 @@ def apply_port_changes(
             in any ``None`` fields in :class:`PortConfig`).
         change_set: Planned changes as returned by
             :func:`~napalm_jtcom.utils.port_diff.plan_port_changes`.
+        batch: When ``False``, send one POST per port instead of grouping.
 
     Raises:
         ValueError: If a required speed/duplex token is unknown.
@@ -77,12 +82,30 @@ def apply_port_changes(
 
     settings_by_id: dict[int, PortSettings] = {s.port_id: s for s in current_settings}
 
+    # Every payload is built (and validated) before the first write.
+    writes: list[tuple[tuple[str, str, str], list[str]]] = []
+    groups: dict[tuple[str, str, str], list[str]] = {}
     for cfg in change_set.update:
-        current = settings_by_id.get(cfg.port_id)
-        payload = _build_port_payload(cfg, current)
-        logger.debug("Setting port %d: %s", cfg.port_id, payload)
-        session.post(PORT_SETTINGS, data=payload)
-        logger.info("Port %d configuration applied", cfg.port_id)
+        payload = _build_port_payload(cfg, settings_by_id.get(cfg.port_id))
+        key = (payload["state"], payload["speed_duplex"], payload["flow"])
+        if batch and key in groups:
+            groups[key].append(payload["portid"])
+        else:
+            groups[key] = [payload["portid"]]
+            writes.append((key, groups[key]))
+
+    for (state, speed_code, flow), portids in writes:
+        form = [
+            *(("portid", portid) for portid in portids),
+            ("state", state),
+            ("speed_duplex", speed_code),
+            ("flow", flow),
+        ]
+        logger.debug("Setting port(s) %s: %s", portids, form)
+        session.post(PORT_SETTINGS, data=form)
+        logger.info(
+            "Port %s configuration applied", ", ".join(str(int(p) + 1) for p in portids)
+        )
 
 
 def _build_port_payload(
@@ -122,12 +145,13 @@ def _build_port_payload(
         speed_token = current.speed_duplex if current is not None else None
     if speed_token is None:
         raise ValueError(f"port_id={desired.port_id}: speed_duplex is None and no current settings")
-    speed_code = SPEED_TOKEN_TO_CODE.get(speed_token)
-    if speed_code is None:
+    try:
+        speed_code = SPEED_TOKEN_TO_CODE[speed_token]
+    except KeyError:
         raise ValueError(
             f"port_id={desired.port_id}: unknown speed/duplex token {speed_token!r}; "
-            f"valid tokens: {sorted(SPEED_TOKEN_TO_CODE)}"
-        )
+            f"valid tokens: {list(_VALID_SPEED_TOKENS)}"
+        ) from None
 
     # Resolve flow_control
     flow_control: bool
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import itertools
+import json
 import logging
+import os
+import pathlib
 import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from napalm_jtcom.client.errors import (
     CODE_AUTH_EXPIRED,
@@ -13,14 +19,53 @@ from napalm_jtcom.client.errors import (
     JTComParseError,
     JTComSwitchError,
 )
-from napalm_jtcom.client.http import JTComHTTP
+from napalm_jtcom.client.http import RETRY_TOTAL, JTComHTTP
 from napalm_jtcom.vendor.jtcom.endpoints import CONFIG_BACKUP, LOGIN, SYSCMD
 
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON decoding
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Both decoders raise a ValueError subclass on malformed input.
+_json_loads: Callable[[str | bytes], Any] = json.loads if orjson is None else orjson.loads
+
+_T = TypeVar("_T")
+
 # Query / form field injected into every request so the switch accepts it.
 _PAGE_PARAM: str = "inside"
 
+# Chunk size for streaming a configuration backup to disk.
+_BACKUP_CHUNK_SIZE: int = 64 * 1024
+
+# POST form fields: a mapping, or ``(key, value)`` pairs for repeated keys.
+FormFields = Mapping[str, str] | Sequence[tuple[str, str]]
+
+
+def _parse_json(body: bytes, endpoint: str) -> dict[str, object]:
+    """Parse the raw response *body* as JSON.
+
+    The bytes are decoded directly, skipping the charset detection
+    :attr:`requests.Response.text` runs on bodies without a declared
+    encoding.
+
+    Raises:
+        JTComParseError: If *body* is not valid JSON.
+    """
+    try:
+        result: dict[str, object] = _json_loads(body)
+    except ValueError as exc:
+        snippet = body[:200].decode("utf-8", "replace")
+        raise JTComParseError(
+            f"Non-JSON response from {endpoint!r}: {snippet!r}"
+        ) from exc
+    return result
+
 
 @dataclass(frozen=True)
 class JTComCredentials:
@@ -40,15 +85,25 @@ class JTComSession:
 
     Wraps :class:`.JTComHTTP` and adds:
     - Cookie-based authentication via ``login.cgi``.
-    - Automatic ``page=inside`` and ``stamp=<unix_ts>`` injection for GET.
+    - Automatic ``page=inside`` and ``stamp=<counter>`` injection for GET
+      (the counter starts at the Unix time the session was created).
     - Automatic ``page=inside`` injection for POST form data.
     - Single transparent re-login on ``code=11`` (auth expired) responses.
+    - Optional short-lived snapshots of GET pages and their parsed form,
+      dropped on every POST.
 
     Args:
         base_url: Switch base URL, e.g. ``http://192.168.1.1``.
         credentials: Username/password pair.
         timeout_s: Request timeout in seconds (default 30).
         verify_tls: Whether to verify TLS certificates (default True).
+        http_session: Optional shared :class:`requests.Session` passed
+            through to :class:`.JTComHTTP`.
+        snapshot_ttl: Seconds a GET response (and any result parsed from it
+            via :meth:`get_parsed`) is reused for an identical request.
+            ``0`` (the default) disables snapshots.
+        max_retries: Transport retry budget passed through to
+            :class:`.JTComHTTP`.
     """
 
     def __init__(
@@ -57,14 +112,25 @@ class JTComSession:
         credentials: JTComCredentials,
         timeout_s: float = 30.0,
         verify_tls: bool = True,
+        http_session: requests.Session | None = None,
+        snapshot_ttl: float = 0.0,
+        max_retries: int = RETRY_TOTAL,
     ) -> None:
         self._http: JTComHTTP = JTComHTTP(
             base_url=base_url,
             timeout_s=timeout_s,
             verify_tls=verify_tls,
+            session=http_session,
+            max_retries=max_retries,
         )
         self._credentials: JTComCredentials = credentials
         self._logged_in: bool = False
+        self._snapshot_ttl: float = snapshot_ttl
+        self._snapshots: dict[tuple[Any, ...], tuple[float, str]] = {}
+        self._parsed: dict[tuple[Any, ...], tuple[float, Any]] = {}
+        # Cache-busting ``stamp`` values: seeded from the clock once, then a
+        # per-session counter so every request still gets a unique value.
+        self._stamps: Iterator[int] = itertools.count(int(time.time()))
 
     # ------------------------------------------------------------------
     # Authentication
@@ -86,7 +152,7 @@ class JTComSession:
                 "password": self._credentials.password,
             },
         )
-        result = self._parse_json(resp.text, LOGIN)
+        result = _parse_json(resp.content, LOGIN)
         if result["code"] != CODE_OK:
             self._logged_in = False
             raise JTComAuthError(
@@ -111,7 +177,10 @@ class JTComSession:
             logger.debug("Logged out from %s", self._http.base_url)
 
     def ensure_session(self) -> None:
-        """Log in if not already logged in."""
+        """Log in if not already logged in.
+
+        The request methods inline this check rather than calling it.
+        """
         if not self._logged_in:
             self.login()
 
@@ -126,7 +195,7 @@ class JTComSession:
     ) -> str:
         """Perform an authenticated GET and return the response text.
 
-        Injects ``page=inside`` and ``stamp=<unix_timestamp>`` query params.
+        Injects ``page=inside`` and a unique ``stamp`` query param.
 
         Args:
             path: CGI path relative to the switch base URL.
@@ -135,20 +204,53 @@ class JTComSession:
         Returns:
             Response body as a string.
         """
-        self.ensure_session()
-        injected: dict[str, str] = {
-            "page": _PAGE_PARAM,
-            "stamp": str(int(time.time())),
-        }
-        if params:
-            injected.update(params)
-        resp = self._http.get(path, params=injected)
+        key = self._snapshot_key(path, params)
+        if self._snapshot_ttl > 0:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and time.monotonic() - snapshot[0] < self._snapshot_ttl:
+                return snapshot[1]
+        if not self._logged_in:
+            self.login()
+        resp = self._http.get(path, params=self._get_params(params))
+        if self._snapshot_ttl > 0:
+            self._snapshots[key] = (time.monotonic(), resp.text)
         return resp.text
 
+    def get_parsed(
+        self,
+        path: str,
+        parser: Callable[[str], _T],
+        params: dict[str, str] | None = None,
+    ) -> _T:
+        """GET *path* and return ``parser(html)``, reusing a fresh snapshot.
+
+        With snapshots enabled the parsed result is shared between callers
+        until the next POST or TTL expiry, so it must be treated as
+        read-only.
+
+        Args:
+            path: CGI path relative to the switch base URL.
+            parser: Function turning the page HTML into a result.
+            params: Additional query parameters, as for :meth:`get`.
+
+        Returns:
+            The parser's result.
+        """
+        if self._snapshot_ttl <= 0:
+            return parser(self.get(path, params))
+        key = (*self._snapshot_key(path, params), parser)
+        cached = self._parsed.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._snapshot_ttl:
+            result: _T = cached[1]
+            return result
+        parsed = parser(self.get(path, params))
+        self._parsed[key] = (time.monotonic(), parsed)
+        return parsed
+
     def post(
         self,
         path: str,
-        data: dict[str, str] | list[tuple[str, str]] | None = None,
+        data: FormFields | None = None,
     ) -> dict[str, object]:
         """Perform an authenticated POST and return the parsed JSON payload.
 
@@ -157,9 +259,9 @@ class JTComSession:
 
         Args:
             path: CGI path relative to the switch base URL.
-            data: Additional form fields.  Either a ``dict`` for simple payloads
-                or a ``list[tuple[str, str]]`` when repeated keys are needed
-                (e.g. multiple ``del=`` fields for bulk VLAN deletion).
+            data: Additional form fields.  Either a mapping for simple payloads
+                or a sequence of ``(key, value)`` pairs when repeated keys are
+                needed (e.g. multiple ``del=`` fields for bulk VLAN deletion).
 
         Returns:
             Parsed JSON response as ``{"code": int, "data": str, ...}``.
@@ -168,7 +270,10 @@ class JTComSession:
             JTComSwitchError: If the switch returns a non-zero, non-11 code
                               (or still fails after the retry).
         """
-        self.ensure_session()
+        if not self._logged_in:
+            self.login()
+        # Any write may change what the cached pages show.
+        self.invalidate_snapshots()
         result = self._do_post(path, data)
 
         if result["code"] == CODE_AUTH_EXPIRED:
@@ -196,16 +301,47 @@ class JTComSession:
         Returns:
             Raw binary content of the switch configuration backup.
         """
-        self.ensure_session()
+        if not self._logged_in:
+            self.login()
+        resp = self._http.get(CONFIG_BACKUP, params=self._get_params({"cmd": "conf_backup"}))
+        return resp.content
+
+    def download_config_backup_to(self, path: pathlib.Path) -> int:
+        """Stream a configuration backup from the switch straight into *path*.
+
+        Unlike :meth:`download_config_backup`, the backup is never held in
+        memory as a whole; it is written in chunks as it arrives.  The chunks
+        go to a sibling ``.part`` file that only replaces *path* once the
+        whole backup has arrived, so a failed transfer never leaves a
+        truncated backup behind.
+
+        Args:
+            path: Destination file; created or replaced.
+
+        Returns:
+            Number of bytes written.
+        """
+        if not self._logged_in:
+            self.login()
         resp = self._http.get(
-            CONFIG_BACKUP,
-            params={
-                "cmd": "conf_backup",
-                "page": _PAGE_PARAM,
-                "stamp": str(int(time.time())),
-            },
+            CONFIG_BACKUP, params=self._get_params({"cmd": "conf_backup"}), stream=True
         )
-        return resp.content
+        part_path = path.with_name(path.name + ".part")
+        written = 0
+        try:
+            with resp, part_path.open("wb") as fh:
+                for chunk in resp.iter_content(chunk_size=_BACKUP_CHUNK_SIZE):
+                    written += fh.write(chunk)
+            os.replace(part_path, path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        return written
+
+    def invalidate_snapshots(self) -> None:
+        """Drop every cached GET snapshot and parsed result."""
+        self._snapshots.clear()
+        self._parsed.clear()
 
     def close(self) -> None:
         """Logout and close the underlying HTTP session."""
@@ -234,30 +370,27 @@ class JTComSession:
     def _do_post(
         self,
         path: str,
-        data: dict[str, str] | list[tuple[str, str]] | None,
+        data: FormFields | None,
     ) -> dict[str, object]:
         """Send one POST (with page injection) and parse JSON."""
         form: dict[str, str] | list[tuple[str, str]]
-        if isinstance(data, list):
+        if not data:
+            form = {"page": _PAGE_PARAM}
+        elif isinstance(data, Mapping):
+            form = {"page": _PAGE_PARAM, **data}
+        else:
             # Preserve repeated keys (e.g. del=10&del=20); inject page at front.
             form = [("page", _PAGE_PARAM), *data]
-        else:
-            form_dict: dict[str, str] = {"page": _PAGE_PARAM}
-            if data:
-                form_dict.update(data)
-            form = form_dict
         resp = self._http.post_form(path, data=form)
-        return self._parse_json(resp.text, path)
+        return _parse_json(resp.content, path)
 
-    @staticmethod
-    def _parse_json(text: str, endpoint: str) -> dict[str, object]:
-        """Parse *text* as JSON, raising :exc:`.JTComParseError` on failure."""
-        import json
+    def _get_params(self, params: dict[str, str] | None) -> dict[str, str]:
+        """Return GET query params with ``page`` and ``stamp`` injected first."""
+        stamp = str(next(self._stamps))
+        if not params:
+            return {"page": _PAGE_PARAM, "stamp": stamp}
+        return {"page": _PAGE_PARAM, "stamp": stamp, **params}
 
-        try:
-            result: dict[str, object] = json.loads(text)
-        except (json.JSONDecodeError, ValueError) as exc:
-            raise JTComParseError(
-                f"Non-JSON response from {endpoint!r}: {text[:200]!r}"
-            ) from exc
-        return result
+    @staticmethod
+    def _snapshot_key(path: str, params: dict[str, str] | None) -> tuple[Any, ...]:
+        return (path, tuple(sorted(params.items())) if params else ())
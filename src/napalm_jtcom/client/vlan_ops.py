@@ -35,6 +35,7 @@ logger = logging.getLogger(__name__)
 # VlanType values understood by the switch firmware.
 _VLAN_TYPE_ACCESS: str = "0"
 _VLAN_TYPE_TRUNK: str = "1"
+_VALID_VLAN_TYPES: frozenset[str] = frozenset({"access", "trunk"})
 
 
 def vlan_create(
@@ -54,14 +55,25 @@ def vlan_create(
         JTComSwitchError: If the switch returns a non-zero response code.
     """
     logger.debug("Creating VLAN %d (name=%r)", vlan_id, name)
-    session.post(
-        VLAN_CREATE_DELETE,
-        data={
-            "vlanid": str(vlan_id),
-            "vlanname": name or "",
-            "cmd": "add",
-        },
-    )
+    session.post(VLAN_CREATE_DELETE, data=vlan_create_form(vlan_id, name))
+
+
+def vlan_create_form(vlan_id: int, name: str | None = None) -> dict[str, str]:
+    """Return the ``staticvlan.cgi`` form fields that create or rename a VLAN.
+
+    Args:
+        vlan_id: 802.1Q VLAN identifier.
+        name: Optional human-readable VLAN name.
+
+    Returns:
+        Form fields for :data:`VLAN_CREATE_DELETE` (``page`` is injected by
+        the session).
+    """
+    return {
+        "vlanid": str(vlan_id),
+        "vlanname": name or "",
+        "cmd": "add",
+    }
 
 
 def vlan_delete(
@@ -71,7 +83,8 @@ def vlan_delete(
     """Delete one or more static VLANs from the switch.
 
     The switch accepts multiple ``del`` keys in a single POST body.
-    VLAN 1 is silently skipped even if included in *vlan_ids*.
+    VLAN 1 is silently skipped even if included in *vlan_ids*, and repeated
+    IDs are sent once.
 
     Args:
         session: Active authenticated session.
@@ -81,7 +94,8 @@ def vlan_delete(
         ValueError: If *vlan_ids* is empty after filtering out VLAN 1.
         JTComSwitchError: If the switch returns a non-zero response code.
     """
-    safe_ids = [v for v in vlan_ids if v != 1]
+    # Dedup while filtering: diff planners can hand over repeated IDs.
+    safe_ids = sorted({v for v in vlan_ids if v != 1})
     if not safe_ids:
         raise ValueError("vlan_ids must contain at least one deletable VLAN (not 1)")
 
@@ -90,7 +104,7 @@ def vlan_delete(
     # requests.Session.post() with data= only sends one value per key when
     # data is a dict.  Pass a list of tuples so repeated del= keys are preserved.
     # session.post() injects page=inside and handles code=11 auth-expiry retry.
-    form_fields: list[tuple[str, str]] = [("del", str(v)) for v in sorted(safe_ids)]
+    form_fields: list[tuple[str, str]] = [("del", str(v)) for v in safe_ids]
     form_fields.append(("cmd", "del"))
     session.post(VLAN_CREATE_DELETE, data=form_fields)
 
@@ -122,15 +136,41 @@ def vlan_set_port(
         ValueError: If *port_ids* is empty or *vlan_type* is invalid.
         JTComSwitchError: If the switch returns a non-zero response code.
     """
+    form = vlan_port_form(port_ids, vlan_type, access_vlan, native_vlan, permit_vlans)
+    session.post(VLAN_PORT_SET, data=form)
+
+
+def vlan_port_form(
+    port_ids: list[int],
+    vlan_type: str,
+    access_vlan: int | None,
+    native_vlan: int | None,
+    permit_vlans: list[int],
+) -> dict[str, str]:
+    """Return the ``vlanport.cgi`` form fields for :func:`vlan_set_port`.
+
+    Args:
+        port_ids: 1-based port IDs.
+        vlan_type: ``"access"`` or ``"trunk"`` (case-insensitive).
+        access_vlan: VLAN ID for Access mode (ignored in Trunk mode).
+        native_vlan: Native VLAN ID for Trunk mode (ignored in Access mode).
+        permit_vlans: Full JTCom trunk permit list.
+
+    Returns:
+        Form fields for :data:`VLAN_PORT_SET`.
+
+    Raises:
+        ValueError: If *port_ids* is empty or *vlan_type* is invalid.
+    """
     if not port_ids:
         raise ValueError("port_ids must not be empty")
     if any(port_id < 1 for port_id in port_ids):
         raise ValueError(f"port_ids must be 1-based positive integers, got {port_ids!r}")
     vt_lower = vlan_type.lower()
-    if vt_lower not in {"access", "trunk"}:
+    if vt_lower not in _VALID_VLAN_TYPES:
         raise ValueError(f"vlan_type must be 'access' or 'trunk', got {vlan_type!r}")
 
-    port_id_str = "_".join(str(p - 1) for p in sorted(port_ids))
+    port_id_str = "_".join([str(p - 1) for p in sorted(port_ids)])
 
     if vt_lower == "access":
         vlan_type_val = _VLAN_TYPE_ACCESS
@@ -141,19 +181,16 @@ def vlan_set_port(
         vlan_type_val = _VLAN_TYPE_TRUNK
         av = "1"
         nv = str(native_vlan) if native_vlan is not None else "1"
-        pv = "_".join(str(v) for v in sorted(permit_vlans))
+        pv = "_".join(map(str, sorted(permit_vlans)))
 
     logger.debug(
         "Setting port(s) %s → %s (AccessVlan=%s NativeVlan=%s PermitVlan=%s)",
         port_id_str, vlan_type, av, nv, pv,
     )
-    session.post(
-        VLAN_PORT_SET,
-        data={
-            "PortId": port_id_str,
-            "VlanType": vlan_type_val,
-            "AccessVlan": av,
-            "NativeVlan": nv,
-            "PermitVlan": pv,
-        },
-    )
+    return {
+        "PortId": port_id_str,
+        "VlanType": vlan_type_val,
+        "AccessVlan": av,
+        "NativeVlan": nv,
+        "PermitVlan": pv,
+    }
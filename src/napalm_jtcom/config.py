@@ -0,0 +1,82 @@
+"""Connection settings read from ``JTCOM_*`` environment variables."""
+
+from __future__ import annotations
+
+import functools
+import os
+from dataclasses import dataclass
+from typing import Any
+
+# Values of ``<prefix>VERIFY_TLS`` that enable certificate verification.
+_TRUTHY: frozenset[str] = frozenset({"1", "true", "yes", "on"})
+_FIELDS: tuple[str, ...] = ("host", "username", "password")
+
+
+@dataclass(slots=True, frozen=True)
+class Settings:
+    """Validated connection settings for a JTCom switch.
+
+    Attributes:
+        host: Switch base URL or IP address.
+        username: Login username.
+        password: Login password.
+        verify_tls: Whether to verify TLS certificates.
+    """
+
+    host: str
+    username: str
+    password: str
+    verify_tls: bool = False
+
+    @classmethod
+    def from_env(cls, prefix: str = "JTCOM_", **defaults: str) -> Settings:
+        """Build settings from ``<prefix>HOST``, ``USERNAME``, ``PASSWORD``, ``VERIFY_TLS``.
+
+        Args:
+            prefix: Environment variable name prefix.
+            **defaults: Fallback values for ``host``, ``username`` or
+                ``password`` when the variable is unset or empty.
+
+        Returns:
+            The parsed settings; identical environments return the same object.
+
+        Raises:
+            ValueError: If a setting without a default is unset or empty.
+        """
+        unknown = defaults.keys() - set(_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown setting default(s): {sorted(unknown)}")
+        values = []
+        for field in _FIELDS:
+            name = f"{prefix}{field.upper()}"
+            value = os.environ.get(name) or defaults.get(field)
+            if not value:
+                raise ValueError(f"required environment variable {name!r} is not set")
+            values.append(value)
+        verify_raw = os.environ.get(f"{prefix}VERIFY_TLS", "")
+        return _build(cls, *values, verify_raw.strip().lower() in _TRUTHY)
+
+    def driver_kwargs(self, **optional_args: object) -> dict[str, Any]:
+        """Return keyword arguments for :class:`~napalm_jtcom.driver.JTComDriver`.
+
+        Args:
+            **optional_args: Extra driver ``optional_args`` merged after
+                ``verify_tls``.
+
+        Returns:
+            Mapping with ``hostname``, ``username``, ``password`` and
+            ``optional_args`` keys.
+        """
+        return {
+            "hostname": self.host,
+            "username": self.username,
+            "password": self.password,
+            "optional_args": {"verify_tls": self.verify_tls, **optional_args},
+        }
+
+
+@functools.lru_cache(maxsize=8)
+def _build(
+    cls: type[Settings], host: str, username: str, password: str, verify_tls: bool
+) -> Settings:
+    return cls(host=host, username=username, password=password, verify_tls=verify_tls)
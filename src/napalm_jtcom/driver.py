@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import dataclasses
 import datetime
 import logging
 import pathlib
+import re
+from collections import defaultdict
+from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from napalm.base.base import NetworkDriver
 
+from napalm_jtcom.client.batch import submit_batch
 from napalm_jtcom.client.errors import JTComError, JTComVerificationError
+from napalm_jtcom.client.http import RETRY_TOTAL
+from napalm_jtcom.client.pool import default_pool, pool_enabled
 from napalm_jtcom.client.port_ops import apply_port_changes
 from napalm_jtcom.client.session import JTComCredentials, JTComSession
-from napalm_jtcom.client.vlan_ops import vlan_create, vlan_delete, vlan_set_port
+from napalm_jtcom.client.vlan_ops import vlan_create_form, vlan_delete, vlan_port_form
 from napalm_jtcom.model.config import DeviceConfig
 from napalm_jtcom.model.port import PortChangeSet, PortConfig, PortSettings
-from napalm_jtcom.model.vlan import VlanConfig, VlanEntry
+from napalm_jtcom.model.vlan import VlanConfig, VlanEntry, VlanPortConfig
 from napalm_jtcom.parser.device import parse_device_info, parse_uptime_seconds
 from napalm_jtcom.parser.port import parse_port_page
 from napalm_jtcom.parser.vlan import parse_port_vlan_settings, parse_static_vlans
@@ -40,13 +48,26 @@ from napalm_jtcom.utils.vlan_membership import (
 from napalm_jtcom.vendor.jtcom.endpoints import (
     DEVICE_INFO,
     PORT_SETTINGS,
+    VLAN_CREATE_DELETE,
     VLAN_PORT_BASED,
+    VLAN_PORT_BASED_PARAMS,
+    VLAN_PORT_SET,
     VLAN_STATIC,
+    VLAN_STATIC_PARAMS,
 )
 
 logger = logging.getLogger(__name__)
 
 _VENDOR: str = "JTCom"
+# Default page reuse window: covers a get_*() followed by set_*() without
+# serving state old enough for a concurrent change to matter.
+_SNAPSHOT_TTL_S: float = 2.0
+# Backup file names: hostname with "://" and each other ':' or '/' replaced
+# by '_', plus a timestamp.
+_SAFE_HOST_RE: re.Pattern[str] = re.compile(r"://|[:/]")
+_TS_FMT: str = "%Y%m%d-%H%M%S"
+# get_interfaces() (is_up, speed) for a port missing from the status table.
+_NO_OPER_STATUS: tuple[bool, float] = (False, 0.0)
 
 
 class JTComDriver(NetworkDriver):  # type: ignore[misc]
@@ -75,6 +96,32 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
 
             - ``port`` (int): HTTP port (default 80; 443 when verify_tls=True).
             - ``verify_tls`` (bool): Verify TLS certificates (default ``False``).
+            - ``http_session`` (:class:`requests.Session`): Shared session to
+              reuse kept-alive connections across driver instances.  It is
+              left open by :meth:`close`.
+            - ``max_retries`` (int): Retries for connection errors and
+              429/502/503/504 responses on the driver's own connection pool;
+              POSTs are only retried when the request was never sent
+              (default ``3``).
+            - ``batch_commands`` (bool): Coalesce port settings and VLAN
+              membership writes that share the same payload into one
+              multi-port CGI POST (default ``True``).
+            - ``snapshot_ttl`` (float): Seconds the session reuses a parsed
+              page for repeated reads, e.g. a ``get_vlans()`` followed by
+              ``set_vlans()``; any write drops the snapshots (default ``2``;
+              ``0`` disables).
+            - ``max_parallel_writes`` (int): Number of independent VLAN
+              create/rename and port membership POSTs sent concurrently
+              (default ``1``).
+            - ``parallel_reads`` (bool): Fetch the VLAN and port pages
+              concurrently (default ``False``).
+
+    Setting the ``JTCOM_POOL_ENABLED=1`` environment variable makes
+    :meth:`open` reuse a session from the process-wide
+    :class:`~napalm_jtcom.client.pool.SessionPool` that was built with the
+    same connection options; it logs in again before reuse and is replaced
+    if that fails.  :meth:`close` then returns it to the pool instead of
+    logging out.
     """
 
     def __init__(
@@ -98,7 +145,13 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
                 443 if self._verify_tls else 80,
             )
         )
+        self._base_url: str = self._build_base_url()
+        # Filesystem-safe form of the hostname, used in backup file names.
+        self._safe_host: str = _SAFE_HOST_RE.sub("_", self.hostname)
+        self._backup_dir: pathlib.Path | None = None
         self._session: JTComSession | None = None
+        self._pool_key: tuple[Hashable, ...] | None = None
+        self._last_state: tuple[dict[int, VlanEntry], list[PortSettings]] | None = None
         self._allow_port_mode_change: bool = bool(
             self.optional_args.get("allow_port_mode_change", False)
         )
@@ -108,6 +161,9 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
         self._allow_vlan_delete_in_use: bool = bool(
             self.optional_args.get("allow_vlan_delete_in_use", False)
         )
+        self._batch_commands: bool = bool(self.optional_args.get("batch_commands", True))
+        self._max_parallel_writes: int = int(self.optional_args.get("max_parallel_writes", 1))
+        self._parallel_reads: bool = bool(self.optional_args.get("parallel_reads", False))
 
         logger.debug(
             "JTComDriver initialised: host=%s port=%d user=%s",
@@ -132,27 +188,66 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
         if self._session is not None:
             logger.debug("Session already open; closing before re-open")
             self.close()
-        base_url = self._build_base_url()
+        base_url = self._base_url
         logger.info("Opening connection to %s", base_url)
         creds = JTComCredentials(username=self.username, password=self.password)
-        self._session = JTComSession(
-            base_url=base_url,
-            credentials=creds,
-            timeout_s=float(self.timeout),
-            verify_tls=self._verify_tls,
-        )
-        self._session.login()
+        timeout_s = float(self.timeout)
+        http_session = self.optional_args.get("http_session")
+        snapshot_ttl = float(self.optional_args.get("snapshot_ttl", _SNAPSHOT_TTL_S))
+        max_retries = int(self.optional_args.get("max_retries", RETRY_TOTAL))
+
+        def _login() -> JTComSession:
+            session = JTComSession(
+                base_url=base_url,
+                credentials=creds,
+                timeout_s=timeout_s,
+                verify_tls=self._verify_tls,
+                http_session=http_session,
+                snapshot_ttl=snapshot_ttl,
+                max_retries=max_retries,
+            )
+            session.login()
+            return session
+
+        if pool_enabled():
+            # A pooled session keeps the options it was built with, so all
+            # of them are part of its identity.
+            self._pool_key = (
+                base_url,
+                creds,
+                timeout_s,
+                self._verify_tls,
+                max_retries,
+                snapshot_ttl,
+                http_session,
+            )
+            # GETs carry no auth-expired signal, so a reused session logs in
+            # again over its kept-alive connection before it is handed out.
+            self._session = default_pool().acquire(
+                self._pool_key, _login, validate=JTComSession.login
+            )
+        else:
+            self._session = _login()
 
     def close(self) -> None:
-        """Logout and close the HTTP session (best-effort; never raises)."""
+        """Logout and close the HTTP session (best-effort; never raises).
+
+        A pooled session is returned to the pool instead.
+        """
         if self._session is not None:
             logger.info("Closing connection to %s", self.hostname)
             try:
-                self._session.close()
+                if self._pool_key is not None:
+                    # The next driver to check this session out reads fresh.
+                    self._session.invalidate_snapshots()
+                    default_pool().release(self._pool_key, self._session)
+                else:
+                    self._session.close()
             except Exception:  # noqa: BLE001
                 logger.debug("Session close failed (ignored)", exc_info=True)
             finally:
                 self._session = None
+                self._pool_key = None
 
     # ------------------------------------------------------------------
     # NAPALM getters
@@ -170,16 +265,14 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             JTComParseError: If the device info page cannot be parsed.
         """
         session = self._require_session()
-        html = session.get(DEVICE_INFO)
-        device_info = parse_device_info(html)
+        device_info = session.get_parsed(DEVICE_INFO, parse_device_info)
 
         # Prefer the IP from the page; fall back to the configured hostname.
         hostname = device_info.ip_address or self.hostname
 
         # Populate interface_list from port settings page.
         try:
-            port_html = session.get(PORT_SETTINGS)
-            settings_list, _ = parse_port_page(port_html)
+            settings_list, _ = session.get_parsed(PORT_SETTINGS, parse_port_page)
             interface_list = [s.name for s in settings_list]
         except JTComError:
             logger.warning("Failed to fetch port list for interface_list", exc_info=True)
@@ -212,20 +305,17 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             JTComParseError: If the port page cannot be parsed.
         """
         session = self._require_session()
-        html = session.get(PORT_SETTINGS)
-        settings_list, oper_list = parse_port_page(html)
-        oper_by_id = {op.port_id: op for op in oper_list}
-
-        result: dict[str, Any] = {}
-        for settings in settings_list:
-            oper = oper_by_id.get(settings.port_id)
-            link_up: bool = bool(oper.link_up) if oper is not None else False
-            speed: float = (
-                float(oper.negotiated_speed_mbps)
-                if oper is not None and oper.negotiated_speed_mbps is not None
-                else 0.0
+        settings_list, oper_list = session.get_parsed(PORT_SETTINGS, parse_port_page)
+        # (is_up, speed) per port, resolved once; ports without status are down.
+        oper_by_id: dict[int, tuple[bool, float]] = {
+            op.port_id: (
+                bool(op.link_up),
+                float(op.negotiated_speed_mbps) if op.negotiated_speed_mbps is not None else 0.0,
             )
-            result[settings.name] = {
+            for op in oper_list
+        }
+        return {
+            settings.name: {
                 "is_up": link_up,
                 "is_enabled": settings.admin_up,
                 "description": "",
@@ -234,8 +324,9 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
                 "mtu": 0,
                 "mac_address": "",
             }
-
-        return result
+            for settings in settings_list
+            for link_up, speed in (oper_by_id.get(settings.port_id, _NO_OPER_STATUS),)
+        }
 
     def get_vlans(self) -> dict[str, Any]:
         """Return VLAN information conforming to the NAPALM schema.
@@ -261,7 +352,8 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
 
         result: dict[str, Any] = {}
         for vid, ve in sorted(vlan_map.items()):
-            all_ports = sorted(set(ve.tagged_ports + ve.untagged_ports))
+            # Union straight into a set; no intermediate concatenated list.
+            all_ports = sorted({*ve.tagged_ports, *ve.untagged_ports})
             result[str(vid)] = {"name": ve.name, "interfaces": all_ports}
         return result
 
@@ -273,6 +365,7 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
         allow_port_mode_change: bool | None = None,
         allow_untagged_move: bool | None = None,
         allow_vlan_delete_in_use: bool | None = None,
+        current_state: tuple[dict[int, VlanEntry], list[PortSettings]] | None = None,
     ) -> dict[str, Any]:
         """Apply an incremental VLAN change plan to the switch.
 
@@ -296,6 +389,10 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             allow_vlan_delete_in_use: Override
                 ``optional_args["allow_vlan_delete_in_use"]``.
                 ``True`` allows auto-detaching VLANs before deletion.
+            current_state: A ``(vlan_map, settings_list)`` snapshot previously
+                taken from :attr:`last_state`.  When given, the initial
+                readback is skipped; post-apply membership verification
+                still re-reads the switch.
 
         Returns:
             A dict with keys:
@@ -315,7 +412,10 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
         session = self._require_session()
 
         # --- Fetch current state ---
-        vlan_map, current_ports = self._read_current_state(session)
+        if current_state is not None:
+            vlan_map, current_ports = current_state
+        else:
+            vlan_map, current_ports = self._read_current_state(session)
 
         # --- Plan changes ---
         change_set = plan_vlan_changes(vlan_map, desired_vlans)
@@ -346,24 +446,36 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             )
             return result
 
+        if not (
+            change_set.create
+            or change_set.update
+            or change_set.delete
+            or membership_plan.changed_ports
+        ):
+            return result
+
         # --- Backup before change ---
         if self.optional_args.get("backup_before_change", True):
             result["backup_file"] = self._save_backup(session)
 
-        # --- Apply creates (ascending VID) ---
-        for cfg in change_set.create:
-            vlan_create(session, cfg.vlan_id, cfg.name)
-            logger.info("Created VLAN %d (%s)", cfg.vlan_id, cfg.name)
-
-        # --- Apply updates (ascending VID) ---
-        for cfg in change_set.update:
-            current_entry = vlan_map.get(cfg.vlan_id)
-            if (
-                cfg.name is not None
-                and current_entry is not None
-                and cfg.name != current_entry.name
-            ):
-                vlan_create(session, cfg.vlan_id, cfg.name)
+        # --- Apply creates, then renames (ascending VID) ---
+        renames = [
+            cfg
+            for cfg in change_set.update
+            if cfg.name is not None
+            and (current_entry := vlan_map.get(cfg.vlan_id)) is not None
+            and cfg.name != current_entry.name
+        ]
+        submit_batch(
+            session,
+            VLAN_CREATE_DELETE,
+            [vlan_create_form(cfg.vlan_id, cfg.name) for cfg in (*change_set.create, *renames)],
+            max_parallel=self._max_parallel_writes,
+        )
+        if logger.isEnabledFor(logging.INFO):
+            for cfg in change_set.create:
+                logger.info("Created VLAN %d (%s)", cfg.vlan_id, cfg.name)
+            for cfg in renames:
                 logger.info("Updated VLAN %d (%s)", cfg.vlan_id, cfg.name)
 
         # --- Apply membership changes using full per-port desired state ---
@@ -371,8 +483,9 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
 
         # --- Apply deletes (descending VID) ---
         if change_set.delete:
-            vlan_delete(session, sorted(change_set.delete, reverse=True))
-            logger.info("Deleted VLANs %s", sorted(change_set.delete, reverse=True))
+            delete_order = sorted(change_set.delete, reverse=True)
+            vlan_delete(session, delete_order)
+            logger.info("Deleted VLANs %s", delete_order)
 
         self._verify_vlan_membership(session, membership_plan)
 
@@ -385,6 +498,7 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
         *,
         dry_run: bool = False,
         backup_before_change: bool | None = None,
+        current_state: tuple[dict[int, VlanEntry], list[PortSettings]] | None = None,
     ) -> dict[str, Any]:
         """Apply declarative port configuration to the switch.
 
@@ -403,6 +517,9 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             backup_before_change: Override the ``backup_before_change``
                 optional_arg for this call.  ``None`` means use the
                 optional_args value (default ``True``).
+            current_state: A ``(vlan_map, settings_list)`` snapshot previously
+                taken from :attr:`last_state`; its port settings replace the
+                initial ``port.cgi`` read.
 
         Returns:
             A dict with keys:
@@ -419,8 +536,10 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
         session = self._require_session()
 
         # --- Fetch current state ---
-        html = session.get(PORT_SETTINGS)
-        settings_list, _ = parse_port_page(html)
+        if current_state is not None:
+            settings_list = current_state[1]
+        else:
+            settings_list, _ = session.get_parsed(PORT_SETTINGS, parse_port_page)
 
         # --- Plan changes ---
         change_set: PortChangeSet = plan_port_changes(settings_list, desired_ports)
@@ -446,7 +565,7 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             result["backup_file"] = self._save_backup(session)
 
         # --- Apply changes in ascending port_id order ---
-        apply_port_changes(session, settings_list, change_set)
+        apply_port_changes(session, settings_list, change_set, batch=self._batch_commands)
         logger.info("Port changes applied: %s", result["updated_ports"])
 
         return result
@@ -460,12 +579,14 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
         backup_before_change: bool | None = None,
         allow_untagged_move: bool | None = None,
         allow_vlan_delete_in_use: bool | None = None,
+        current_state: tuple[dict[int, VlanEntry], list[PortSettings]] | None = None,
     ) -> dict[str, Any]:
         """Apply an incremental device configuration to the switch idempotently.
 
         Reads the current switch state, normalizes both current and desired
         configs, computes a deterministic change plan, and applies only what
-        has changed.  A post-apply read-back verifies the result.
+        has changed.  A post-apply read-back of the pages the apply wrote to
+        (VLAN, port, or both) verifies the result.
 
         Each VLAN/port entry in *desired* carries a ``state`` field:
         ``"present"`` to create or update, ``"absent"`` to delete/disable.
@@ -479,6 +600,12 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             allow_untagged_move: Override ``optional_args["allow_untagged_move"]``.
             allow_vlan_delete_in_use: Override
                 ``optional_args["allow_vlan_delete_in_use"]``.
+            current_state: A ``(vlan_map, settings_list)`` snapshot previously
+                taken from :attr:`last_state`.  When given, the initial
+                readback is skipped and post-apply verification re-reads both
+                the VLAN and port pages.  Without it, verification re-reads
+                only the pages that were written and checks the rest against
+                this call's own initial read.
 
         Returns:
             A dict with keys:
@@ -489,7 +616,8 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             - ``"applied"`` — list of change keys that were applied.
 
         Raises:
-            JTComError: If the session is not open.
+            JTComError: If the session is not open or the config backup
+                cannot be saved.
             JTComVerificationError: If post-apply verification detects residual
                 differences between the switch state and *desired*.
         """
@@ -497,7 +625,10 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
         safety_port_id: int = int(self.optional_args.get("safety_port_id", 6))
 
         # --- Read and normalize current state ---
-        current_vlans, current_ports = self._read_current_state(session)
+        if current_state is not None:
+            current_vlans, current_ports = current_state
+        else:
+            current_vlans, current_ports = self._read_current_state(session)
         current_cfg = DeviceConfig.from_current(current_vlans, current_ports)
         current_n = normalize_device_config(current_cfg)
         desired_n = normalize_device_config(desired)
@@ -575,43 +706,69 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
 
         # --- Apply VLAN creates and renames before membership changes ---
         applied: list[str] = []
-        for change in plan.changes:
-            if change.kind == "vlan_create":
-                vid = change.details["vlan_id"]
-                vc = desired_plan_n.vlans[vid]
-                vlan_create(session, vc.vlan_id, vc.name)
-                logger.info("Created VLAN %d (%s)", vid, vc.name)
-                applied.append(change.key)
-            elif change.kind == "vlan_update" and "name" in change.details:
-                vid = change.details["vlan_id"]
-                vc = desired_plan_n.vlans[vid]
-                vlan_create(session, vc.vlan_id, vc.name)
-                logger.info("Updated VLAN %d (%s)", vid, vc.name)
-                applied.append(change.key)
+        vlan_writes = [
+            (change, desired_plan_n.vlans[change.details["vlan_id"]])
+            for change in plan.changes
+            if change.kind == "vlan_create"
+            or (change.kind == "vlan_update" and "name" in change.details)
+        ]
+        submit_batch(
+            session,
+            VLAN_CREATE_DELETE,
+            [vlan_create_form(vc.vlan_id, vc.name) for _, vc in vlan_writes],
+            max_parallel=self._max_parallel_writes,
+        )
+        applied.extend(change.key for change, _ in vlan_writes)
+        if logger.isEnabledFor(logging.INFO):
+            for change, vc in vlan_writes:
+                verb = "Created" if change.kind == "vlan_create" else "Updated"
+                logger.info("%s VLAN %d (%s)", verb, vc.vlan_id, vc.name)
 
         self._apply_vlan_membership_plan(session, membership_plan)
         applied.extend(
             f"vlan_membership:port:{port_id}" for port_id in membership_plan.changed_ports
         )
 
-        for change in plan.changes:
-            if change.kind == "port_update":
-                pid = change.details["port_id"]
-                desired_port = desired_n.ports[pid]
-                port_cs = PortChangeSet(update=[desired_port])
-                apply_port_changes(session, current_ports, port_cs)
-                logger.info("Updated port %d", pid)
-                applied.append(change.key)
+        # One apply_port_changes() call indexes current_ports once for all
+        # updated ports instead of once per port.
+        port_changes = [change for change in plan.changes if change.kind == "port_update"]
+        if port_changes:
+            port_cs = PortChangeSet(
+                update=[desired_n.ports[change.details["port_id"]] for change in port_changes]
+            )
+            apply_port_changes(session, current_ports, port_cs, batch=self._batch_commands)
+            applied.extend(change.key for change in port_changes)
+            if logger.isEnabledFor(logging.INFO):
+                for change in port_changes:
+                    logger.info("Updated port %d", change.details["port_id"])
 
+        vlan_deleted = False
         for change in plan.changes:
             if change.kind == "vlan_delete":
                 vid = change.details["vlan_id"]
                 vlan_delete(session, [vid])
                 logger.info("Deleted VLAN %d", vid)
                 applied.append(change.key)
+                vlan_deleted = True
 
         # --- Post-apply verification ---
-        post_vlans, post_ports = self._read_current_state(session)
+        # Only re-read the pages a write could have changed; the untouched
+        # slice is still the state this call read before applying.  A
+        # supplied current_state was not read here, so it is never trusted
+        # for verification.  A plan change that needed no write at all can
+        # only be a VLAN membership update, so without any write the VLAN
+        # pages are re-read rather than checking the plan against its input.
+        vlans_written = bool(vlan_writes or membership_plan.changed_ports or vlan_deleted)
+        reread_vlans = vlans_written or not port_changes
+        if current_state is not None or (reread_vlans and port_changes):
+            post_vlans, post_ports = self._read_current_state(session)
+        else:
+            post_vlans, post_ports = current_vlans, current_ports
+            if reread_vlans:
+                post_vlans = self._fetch_vlan_state(session)
+            else:
+                post_ports, _ = session.get_parsed(PORT_SETTINGS, parse_port_page)
+            self._last_state = (post_vlans, post_ports)
         post_cfg = DeviceConfig.from_current(post_vlans, post_ports)
         post_n = normalize_device_config(post_cfg)
         residual_plan = build_device_plan(
@@ -621,7 +778,7 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
         )
         if residual_plan.changes:
             raise JTComVerificationError(remaining_diff=render_diff(residual_plan))
-        self._verify_vlan_membership(session, membership_plan)
+        self._verify_vlan_membership(session, membership_plan, (post_vlans, post_ports))
 
         return {
             "changed": True,
@@ -674,7 +831,16 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
         session: JTComSession,
         membership_plan: VlanMembershipPlan,
     ) -> None:
-        """Compile canonical desired state to JTCom backend state at write time."""
+        """Compile canonical desired state to JTCom backend state at write time.
+
+        When ``batch_commands`` is enabled (the default), ports that compile to
+        an identical backend state are written with a single ``vlanport.cgi``
+        POST carrying all their port IDs; otherwise one POST is sent per port.
+        Each POST touches a disjoint set of ports, so with
+        ``max_parallel_writes > 1`` they are dispatched concurrently.
+        """
+        writes: dict[tuple[str, int | None, int | None, tuple[int, ...]], list[int]] = {}
+        forms: list[dict[str, str]] = []
         for port_id in membership_plan.changed_ports:
             desired_state = copy_port_state(membership_plan.desired_per_port[port_id])
             # This is the only place where canonical desired port state is
@@ -690,38 +856,62 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             # JTCom backend uses access_vlan or native_vlan + permit_vlans,
             # and permit_vlans includes the native VLAN on trunk ports.
             if backend_state["mode"] == "trunk":
-                vlan_set_port(
-                    session,
-                    port_ids=[port_id],
-                    vlan_type="trunk",
-                    access_vlan=None,
-                    native_vlan=backend_state["native_vlan"],
-                    permit_vlans=list(backend_state["permit_vlans"]),
+                key = (
+                    "trunk",
+                    None,
+                    backend_state["native_vlan"],
+                    tuple(backend_state["permit_vlans"]),
                 )
             elif backend_state["mode"] == "access":
-                vlan_set_port(
-                    session,
-                    port_ids=[port_id],
-                    vlan_type="access",
-                    access_vlan=backend_state["access_vlan"],
-                    native_vlan=None,
-                    permit_vlans=[],
-                )
+                key = ("access", backend_state["access_vlan"], None, ())
+            else:
+                continue
+            if self._batch_commands:
+                writes.setdefault(key, []).append(port_id)
+            else:
+                forms.append(self._port_vlan_form(key, [port_id]))
+
+        forms.extend(self._port_vlan_form(key, port_ids) for key, port_ids in writes.items())
+        submit_batch(session, VLAN_PORT_SET, forms, max_parallel=self._max_parallel_writes)
+
+    @staticmethod
+    def _port_vlan_form(
+        backend_key: tuple[str, int | None, int | None, tuple[int, ...]],
+        port_ids: list[int],
+    ) -> dict[str, str]:
+        """Build one ``vlanport.cgi`` form for ports sharing a backend state."""
+        vlan_type, access_vlan, native_vlan, permit_vlans = backend_key
+        return vlan_port_form(
+            port_ids,
+            vlan_type=vlan_type,
+            access_vlan=access_vlan,
+            native_vlan=native_vlan,
+            permit_vlans=list(permit_vlans),
+        )
 
     def _verify_vlan_membership(
         self,
         session: JTComSession,
         membership_plan: VlanMembershipPlan,
+        post_state: tuple[dict[int, VlanEntry], list[PortSettings]] | None = None,
     ) -> None:
         """Verify changed VLAN membership ports after a real apply.
 
         Expected state comes directly from the canonical plan. Actual state is
         read back from JTCom, normalized to canonical semantics, and compared
         without any backend-shaped reinterpretation.
+
+        Args:
+            session: Active authenticated session.
+            membership_plan: The plan that was just applied.
+            post_state: A ``(vlan_map, settings_list)`` readback taken after
+                the apply; read from the switch when omitted.
         """
         if not membership_plan.changed_ports:
             return
-        post_vlans, post_ports = self._read_current_state(session)
+        post_vlans, post_ports = (
+            post_state if post_state is not None else self._read_current_state(session)
+        )
         post_per_port = build_current_per_port_from_vlans(
             post_vlans,
             [settings.port_id for settings in post_ports],
@@ -743,6 +933,34 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
                 }
             )
 
+    def _get_vlan_pages(
+        self, session: JTComSession
+    ) -> tuple[list[VlanEntry], list[VlanPortConfig]]:
+        """Fetch and parse the static and port-based VLAN pages.
+
+        With ``parallel_reads`` the port-based page is fetched on a worker
+        thread while this thread fetches the static list, so the two round
+        trips overlap on the keep-alive pool.
+        """
+        if not self._parallel_reads:
+            return (
+                session.get_parsed(VLAN_STATIC, parse_static_vlans, params=VLAN_STATIC_PARAMS),
+                session.get_parsed(
+                    VLAN_PORT_BASED, parse_port_vlan_settings, params=VLAN_PORT_BASED_PARAMS
+                ),
+            )
+        # Log in once up front so the two requests cannot race to do it.
+        session.ensure_session()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="jtcom-read") as executor:
+            port_future = executor.submit(
+                session.get_parsed,
+                VLAN_PORT_BASED,
+                parse_port_vlan_settings,
+                VLAN_PORT_BASED_PARAMS,
+            )
+            vlans = session.get_parsed(VLAN_STATIC, parse_static_vlans, params=VLAN_STATIC_PARAMS)
+            return vlans, port_future.result()
+
     def _fetch_vlan_state(self, session: JTComSession) -> dict[int, VlanEntry]:
         """Fetch static VLANs and port-based VLAN settings, merge into a map.
 
@@ -758,37 +976,60 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             A ``dict[int, VlanEntry]`` keyed by VLAN ID with port memberships
             populated.
         """
-        static_html = session.get(VLAN_STATIC, params={"page": "static"})
-        port_html = session.get(VLAN_PORT_BASED, params={"page": "port_based"})
-        vlans = parse_static_vlans(static_html)
-        port_configs = parse_port_vlan_settings(port_html)
+        vlans, port_configs = self._get_vlan_pages(session)
 
-        vlan_map: dict[int, VlanEntry] = {v.vlan_id: v for v in vlans}
         known_ports = [port_name_to_id(pc.port_name) for pc in port_configs]
         current_per_port = build_current_per_port_from_jtcom_readback(
             port_configs,
             known_ports,
         )
-        port_name_by_id = {
-            port_name_to_id(pc.port_name): pc.port_name
-            for pc in port_configs
+        port_name_by_id = dict(
+            zip(known_ports, (pc.port_name for pc in port_configs), strict=True)
+        )
+        untagged_by_vid, tagged_by_vid = self._build_membership(
+            current_per_port, port_name_by_id
+        )
+
+        # Parsed entries may be shared session snapshots; fill in copies.
+        vlan_map: dict[int, VlanEntry] = {
+            v.vlan_id: dataclasses.replace(
+                v,
+                tagged_ports=[*v.tagged_ports, *tagged_by_vid.get(v.vlan_id, ())],
+                untagged_ports=[*v.untagged_ports, *untagged_by_vid.get(v.vlan_id, ())],
+            )
+            for v in vlans
         }
+        return vlan_map
+
+    @staticmethod
+    def _build_membership(
+        current_per_port: PortMembershipMap,
+        port_name_by_id: dict[int, str],
+    ) -> tuple[dict[int, list[str]], dict[int, list[str]]]:
+        """Group port names by the VLANs they carry, in a single pass.
+
+        Args:
+            current_per_port: Canonical per-port membership readback.
+            port_name_by_id: Display name for each known port ID.
+
+        Returns:
+            ``(untagged_by_vid, tagged_by_vid)`` mapping VLAN IDs to port names
+            in port order.
+        """
+        untagged_by_vid: defaultdict[int, list[str]] = defaultdict(list)
+        tagged_by_vid: defaultdict[int, list[str]] = defaultdict(list)
         for port_id, state in current_per_port.items():
             port_name = port_name_by_id.get(port_id)
             if port_name is None:
                 continue
             untagged_vlan = state["untagged_vlan"]
             if isinstance(untagged_vlan, int):
-                entry = vlan_map.get(untagged_vlan)
-                if entry is not None:
-                    entry.untagged_ports.append(port_name)
+                untagged_by_vid[untagged_vlan].append(port_name)
             tagged_vlans = state["tagged_vlans"]
             if isinstance(tagged_vlans, set):
                 for vid in sorted(tagged_vlans):
-                    entry = vlan_map.get(vid)
-                    if entry is not None:
-                        entry.tagged_ports.append(port_name)
-        return vlan_map
+                    tagged_by_vid[vid].append(port_name)
+        return untagged_by_vid, tagged_by_vid
 
     def _read_current_state(
         self, session: JTComSession
@@ -802,33 +1043,71 @@ class JTComDriver(NetworkDriver):  # type: ignore[misc]
             A tuple of ``(vlan_map, settings_list)`` where ``vlan_map`` is a
             ``dict[int, VlanEntry]`` (with port memberships populated) and
             ``settings_list`` is a ``list[PortSettings]``.
-        """
-        vlan_map = self._fetch_vlan_state(session)
 
-        port_html2 = session.get(PORT_SETTINGS)
-        settings_list, _ = parse_port_page(port_html2)
+        With ``parallel_reads`` the port page is fetched on a worker thread
+        while the VLAN pages are read, so all three round trips overlap.
+        """
+        if self._parallel_reads:
+            session.ensure_session()
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="jtcom-read") as executor:
+                ports_future = executor.submit(session.get_parsed, PORT_SETTINGS, parse_port_page)
+                vlan_map = self._fetch_vlan_state(session)
+                settings_list, _ = ports_future.result()
+        else:
+            vlan_map = self._fetch_vlan_state(session)
+            settings_list, _ = session.get_parsed(PORT_SETTINGS, parse_port_page)
+        self._last_state = (vlan_map, settings_list)
         return vlan_map, settings_list
 
     def _save_backup(self, session: JTComSession) -> str:
-        """Download a config backup and save it to disk.
+        """Stream a config backup from the switch to disk.
 
         Args:
             session: Active authenticated session.
 
         Returns:
             The local file path of the saved backup.
+
+        Raises:
+            JTComError: If the backup cannot be written to disk.
         """
-        backup_dir = pathlib.Path(str(self.optional_args.get("backup_dir", "./backups")))
-        backup_dir.mkdir(parents=True, exist_ok=True)
-        ts = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
-        safe_host = self.hostname.replace("://", "_").replace("/", "_").replace(":", "_")
-        filename = f"jtcom_{safe_host}_{ts}_switch_cfg.bin"
-        backup_path = backup_dir / filename
-        raw = session.download_config_backup()
-        backup_path.write_bytes(raw)
-        logger.info("Config backup saved to %s (%d bytes)", backup_path, len(raw))
+        backup_path = self._backup_path()
+        try:
+            size = session.download_config_backup_to(backup_path)
+        except OSError as exc:
+            raise JTComError(f"Config backup to {backup_path} failed: {exc}") from exc
+        logger.info("Config backup saved to %s (%d bytes)", backup_path, size)
         return str(backup_path)
 
+    def _backup_path(self) -> pathlib.Path:
+        """Return a fresh timestamped backup file path, creating its directory."""
+        ts = datetime.datetime.now().strftime(_TS_FMT)
+        return self._ensure_backup_dir() / f"jtcom_{self._safe_host}_{ts}_switch_cfg.bin"
+
+    def _ensure_backup_dir(self) -> pathlib.Path:
+        """Return the backup directory, creating it on first use only."""
+        if self._backup_dir is None:
+            backup_dir = pathlib.Path(self.optional_args.get("backup_dir", "./backups"))
+            try:
+                backup_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as exc:
+                raise JTComError(f"Cannot create backup directory {backup_dir}: {exc}") from exc
+            self._backup_dir = backup_dir
+        return self._backup_dir
+
+    @property
+    def last_state(self) -> tuple[dict[int, VlanEntry], list[PortSettings]] | None:
+        """Most recent ``(vlan_map, settings_list)`` read back from the switch.
+
+        ``None`` until the first state read.  Callers may hand it back to
+        :meth:`apply_device_config`, :meth:`set_vlans` or
+        :meth:`set_interfaces` as ``current_state`` and must treat the
+        contained objects as read-only.  Only pass a snapshot taken moments
+        earlier (within ``snapshot_ttl``): changes made on the switch since
+        the read are invisible to the plan.
+        """
+        return self._last_state
+
     def is_alive(self) -> dict[str, bool]:
         """Return liveness status of the HTTP session."""
         return {"is_alive": self._session is not None and self._session.logged_in}
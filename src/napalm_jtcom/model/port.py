@@ -24,7 +24,7 @@ def _validate_vlan_list(vlan_list: list[int] | None, field_name: str) -> None:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class PortSettings:
     """Administrative configuration for a single switch port.
 
@@ -48,7 +48,7 @@ class PortSettings:
             raise ValueError(f"port_id must be >= 1, got {self.port_id}")
 
 
-@dataclass
+@dataclass(slots=True)
 class PortOperStatus:
     """Operational status for a single switch port.
 
@@ -67,7 +67,7 @@ class PortOperStatus:
     duplex: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PortConfig:
     """Desired configuration for a single switch port.
 
@@ -117,7 +117,7 @@ class PortConfig:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class PortChangeSet:
     """A set of planned port configuration changes.
 
@@ -5,6 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Literal
 
+# Recognised ``VlanPortConfig.vlan_type`` values, keyed by their lowercase form.
+_PORT_VLAN_MODES: dict[str, Literal["access", "trunk"]] = {"access": "access", "trunk": "trunk"}
+
 
 def _validate_port_list(port_list: list[int] | None, field_name: str) -> None:
     """Helper to validate port lists."""
@@ -25,7 +28,7 @@ def _normalize_op_list(op_list: list[int] | None, field_name: str) -> set[int]:
     return set(op_list)
 
 
-@dataclass
+@dataclass(slots=True)
 class VlanEntry:
     """Represents a single VLAN configuration entry.
 
@@ -48,7 +51,7 @@ class VlanEntry:
             raise ValueError(f"vlan_id must be 1-4094, got {self.vlan_id}")
 
 
-@dataclass
+@dataclass(slots=True)
 class VlanPortConfig:
     """Per-port VLAN configuration parsed from the port-based VLAN page.
 
@@ -58,6 +61,8 @@ class VlanPortConfig:
         access_vlan: Access VLAN ID (Access mode only; None if not set).
         native_vlan: Native/untagged VLAN ID (Trunk mode only; None if not set).
         permit_vlans: List of tagged VLAN IDs allowed on this trunk port.
+        mode: ``vlan_type`` folded to ``"access"`` / ``"trunk"`` once at
+            construction; ``None`` for any other value.
     """
 
     port_name: str
@@ -65,9 +70,13 @@ class VlanPortConfig:
     access_vlan: int | None = None
     native_vlan: int | None = None
     permit_vlans: list[int] = field(default_factory=list)
+    mode: Literal["access", "trunk"] | None = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        self.mode = _PORT_VLAN_MODES.get(self.vlan_type.lower())
 
 
-@dataclass
+@dataclass(slots=True)
 class VlanConfig:
     """Desired VLAN state used as input to :func:`plan_vlan_changes`.
 
@@ -214,7 +223,7 @@ class VlanConfig:
         return normalized
 
 
-@dataclass
+@dataclass(slots=True)
 class VlanChangeSet:
     """A set of planned VLAN changes produced by :func:`plan_vlan_changes`.
 
@@ -4,10 +4,16 @@ from __future__ import annotations
 
 import re
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 from napalm_jtcom.client.errors import JTComParseError
 from napalm_jtcom.model.device import DeviceInfo
+from napalm_jtcom.parser.html import element_text, parse_html_tree
+
+# Only table rows carry label/value pairs; cells are searched below each row.
+_TABLE_ROWS: etree.XPath = etree.XPath("//table//tr")
+_CELLS: etree.XPath = etree.XPath(".//td")
 
 # ---------------------------------------------------------------------------
 # Label → canonical field name mapping (keys must be lowercase and stripped)
@@ -81,8 +87,7 @@ def parse_device_info(html: str) -> DeviceInfo:
     Raises:
         JTComParseError: If the MAC address is absent or malformed.
     """
-    soup = BeautifulSoup(html, "lxml")
-    raw: dict[str, str] = _extract_table_pairs(soup)
+    raw: dict[str, str] = _extract_table_pairs(parse_html_tree(html))
     fields = _map_fields(raw)
     return _build_device_info(fields)
 
@@ -91,15 +96,15 @@ def parse_device_info(html: str) -> DeviceInfo:
 # Internals
 # ---------------------------------------------------------------------------
 
-def _extract_table_pairs(soup: BeautifulSoup) -> dict[str, str]:
+def _extract_table_pairs(root: lxml.html.HtmlElement) -> dict[str, str]:
     """Walk all tables and collect (label, value) pairs from two-cell rows."""
     pairs: dict[str, str] = {}
-    for row in soup.find_all("tr"):
-        cells = row.find_all("td")
+    for row in _TABLE_ROWS(root):
+        cells = _CELLS(row)
         if len(cells) < 2:
             continue
-        label = cells[0].get_text(strip=True)
-        value = cells[1].get_text(strip=True)
+        label = element_text(cells[0])
+        value = element_text(cells[1])
         if label and value:
             pairs[label.lower()] = value
     return pairs
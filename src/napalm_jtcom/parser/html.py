@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import re
 
+import lxml.html
 from bs4 import BeautifulSoup, Tag
 
+_WHITESPACE_RE: re.Pattern[str] = re.compile(r"\s+")
+
 
 def parse_html(html: str, parser: str = "lxml") -> BeautifulSoup:
     """Parse an HTML string and return a BeautifulSoup document.
@@ -20,6 +23,38 @@ def parse_html(html: str, parser: str = "lxml") -> BeautifulSoup:
     return BeautifulSoup(html, parser)
 
 
+def parse_html_tree(html: str) -> lxml.html.HtmlElement:
+    """Parse an HTML string directly with lxml and return the root element.
+
+    Cheaper than :func:`parse_html` for parsers that only need XPath lookups.
+
+    Args:
+        html: Raw HTML content from the switch response.
+
+    Returns:
+        The ``<html>`` root element; an empty document for blank input.
+    """
+    if not html.strip():
+        html = "<html></html>"
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration.
+        return lxml.html.document_fromstring(html.encode("utf-8"))
+
+
+def element_text(element: lxml.html.HtmlElement) -> str:
+    """Return the stripped text of *element*, like ``get_text(strip=True)``.
+
+    Args:
+        element: Element whose descendant text nodes are joined.
+
+    Returns:
+        Each text node stripped, concatenated without separators.
+    """
+    return "".join(text.strip() for text in element.itertext())
+
+
 def normalize_text(s: str) -> str:
     """Strip surrounding whitespace and collapse internal runs.
 
@@ -29,7 +64,7 @@ def normalize_text(s: str) -> str:
     Returns:
         Cleaned string with single spaces between words.
     """
-    return re.sub(r"\s+", " ", s).strip()
+    return _WHITESPACE_RE.sub(" ", s).strip()
 
 
 def find_table_with_headers(
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import re
 
-from bs4 import BeautifulSoup, Tag
+import lxml.html
+from lxml import etree
 
 from napalm_jtcom.client.errors import JTComParseError
 from napalm_jtcom.model.port import PortOperStatus, PortSettings
+from napalm_jtcom.parser.html import element_text, parse_html_tree
 
 # Matches "Port N" port names (case-insensitive), capturing the number.
 _PORT_NAME_RE: re.Pattern[str] = re.compile(r"Port\s*(\d+)", re.IGNORECASE)
@@ -19,6 +21,11 @@ _SPEED_RE: re.Pattern[str] = re.compile(
     re.IGNORECASE,
 )
 
+# Tables that are not part of a config <form>, and rows/cells anywhere below.
+_STANDALONE_TABLES: etree.XPath = etree.XPath("//table[not(ancestor::form)]")
+_ROWS: etree.XPath = etree.XPath(".//tr")
+_CELLS: etree.XPath = etree.XPath(".//td")
+
 
 def parse_port_page(
     html: str,
@@ -38,8 +45,7 @@ def parse_port_page(
     Raises:
         JTComParseError: If the status table cannot be found or yields no rows.
     """
-    soup = BeautifulSoup(html, "lxml")
-    table = _find_status_table(soup)
+    table = _find_status_table(parse_html_tree(html))
     if table is None:
         raise JTComParseError(
             "No port status table found in port.cgi response; "
@@ -49,20 +55,20 @@ def parse_port_page(
     settings_list: list[PortSettings] = []
     oper_list: list[PortOperStatus] = []
 
-    for row in table.find_all("tr"):
-        cells = row.find_all("td")
+    for row in _ROWS(table):
+        cells = _CELLS(row)
         if len(cells) < 6:
             continue  # header rows or spacer rows
-        port_text = cells[0].get_text(strip=True)
+        port_text = element_text(cells[0])
         m = _PORT_NAME_RE.match(port_text)
         if not m:
             continue  # not a port data row
         port_id = int(m.group(1))
 
-        admin_up = cells[1].get_text(strip=True).lower() == "enable"
-        speed_config = cells[2].get_text(strip=True) or None
-        speed_actual = cells[3].get_text(strip=True)
-        flow_text = cells[4].get_text(strip=True).lower()
+        admin_up = element_text(cells[1]).lower() == "enable"
+        speed_config = element_text(cells[2]) or None
+        speed_actual = element_text(cells[3])
+        flow_text = element_text(cells[4]).lower()
         flow_control: bool | None = (
             flow_text == "on" if flow_text in ("on", "off") else None
         )
@@ -120,20 +126,16 @@ def parse_port_settings(html: str) -> list[PortSettings]:
 # Internals
 # ---------------------------------------------------------------------------
 
-def _find_status_table(soup: BeautifulSoup) -> Tag | None:
+def _find_status_table(root: lxml.html.HtmlElement) -> lxml.html.HtmlElement | None:
     """Find the port status ``<table>`` that is NOT inside a ``<form>``.
 
     The status table has data rows with exactly 6 ``<td>`` cells where the
     first cell matches the "Port N" pattern.
     """
-    for table in soup.find_all("table"):
-        if table.find_parent("form"):
-            continue  # skip config-form tables
-        for row in table.find_all("tr"):
-            cells = row.find_all("td")
-            if len(cells) >= 6 and _PORT_NAME_RE.match(
-                cells[0].get_text(strip=True)
-            ):
+    for table in _STANDALONE_TABLES(root):
+        for row in _ROWS(table):
+            cells = _CELLS(row)
+            if len(cells) >= 6 and _PORT_NAME_RE.match(element_text(cells[0])):
                 return table
     return None
 
@@ -5,9 +5,26 @@ from __future__ import annotations
 import contextlib
 import re
 
+import lxml.html
+from lxml import etree
+
 from napalm_jtcom.client.errors import JTComParseError
 from napalm_jtcom.model.vlan import VlanEntry, VlanPortConfig
-from napalm_jtcom.parser.html import normalize_text, parse_html
+from napalm_jtcom.parser.html import normalize_text, parse_html_tree
+
+# Separators between VLAN IDs in the PermitVlan cell (e.g. "10,20" or "10_20").
+_PERMIT_SEP_RE: re.Pattern[str] = re.compile(r"[,_]+")
+
+_VLAN_DEL_FORM: etree.XPath = etree.XPath("//form[@id='vlanDel']")
+_STANDALONE_TABLES: etree.XPath = etree.XPath("//table[not(ancestor::form)]")
+_TABLES: etree.XPath = etree.XPath(".//table")
+_ROWS: etree.XPath = etree.XPath(".//tr")
+_CELLS: etree.XPath = etree.XPath(".//td")
+_HEADER_AND_CELLS: etree.XPath = etree.XPath(".//th | .//td")
+
+
+def _cell_text(cell: lxml.html.HtmlElement) -> str:
+    return normalize_text(cell.text_content())
 
 
 def parse_static_vlans(html: str) -> list[VlanEntry]:
@@ -31,22 +48,21 @@ def parse_static_vlans(html: str) -> list[VlanEntry]:
     Raises:
         JTComParseError: If the VLAN list table cannot be found.
     """
-    soup = parse_html(html)
-    form = soup.find("form", id="vlanDel")
-    if form is None:
+    forms = _VLAN_DEL_FORM(parse_html_tree(html))
+    if not forms:
         raise JTComParseError("Could not find vlanDel form in VLAN static page")
 
-    table = form.find("table")
-    if table is None:
+    tables = _TABLES(forms[0])
+    if not tables:
         raise JTComParseError("Could not find VLAN table inside vlanDel form")
 
     entries: list[VlanEntry] = []
-    for tr in table.find_all("tr"):
-        tds = tr.find_all("td")
+    for tr in _ROWS(tables[0]):
+        tds = _CELLS(tr)
         if len(tds) < 4:
             continue  # skip header rows (only <th>) or incomplete rows
-        vlan_id_text = normalize_text(tds[2].get_text())
-        vlan_name_text = normalize_text(tds[3].get_text())
+        vlan_id_text = _cell_text(tds[2])
+        vlan_name_text = _cell_text(tds[3])
         try:
             vlan_id = int(vlan_id_text)
         except ValueError:
@@ -79,17 +95,10 @@ def parse_port_vlan_settings(html: str) -> list[VlanPortConfig]:
     Raises:
         JTComParseError: If the port VLAN status table cannot be found.
     """
-    soup = parse_html(html)
-
     # Find standalone table (not inside a form) with the right headers
     status_table = None
-    for table in soup.find_all("table"):
-        if table.find_parent("form") is not None:
-            continue
-        cell_texts = [
-            normalize_text(cell.get_text()).lower()
-            for cell in table.find_all(["th", "td"])
-        ]
+    for table in _STANDALONE_TABLES(parse_html_tree(html)):
+        cell_texts = [_cell_text(cell).lower() for cell in _HEADER_AND_CELLS(table)]
         if any(t == "port" for t in cell_texts) and any(
             "vlan type" in t for t in cell_texts
         ):
@@ -103,12 +112,12 @@ def parse_port_vlan_settings(html: str) -> list[VlanPortConfig]:
 
     configs: list[VlanPortConfig] = []
     first_row = True
-    for tr in status_table.find_all("tr"):
-        tds = tr.find_all("td")
+    for tr in _ROWS(status_table):
+        tds = _CELLS(tr)
         if len(tds) < 5:
             continue
-        port_name = normalize_text(tds[0].get_text())
-        vlan_type = normalize_text(tds[1].get_text())
+        port_name = _cell_text(tds[0])
+        vlan_type = _cell_text(tds[1])
 
         # Skip header row if it uses <td> instead of <th>
         if first_row and port_name.lower() == "port":
@@ -116,9 +125,9 @@ def parse_port_vlan_settings(html: str) -> list[VlanPortConfig]:
             continue
         first_row = False
 
-        access_vlan_text = normalize_text(tds[2].get_text())
-        native_vlan_text = normalize_text(tds[3].get_text())
-        permit_vlan_text = normalize_text(tds[4].get_text())
+        access_vlan_text = _cell_text(tds[2])
+        native_vlan_text = _cell_text(tds[3])
+        permit_vlan_text = _cell_text(tds[4])
 
         access_vlan: int | None = None
         if access_vlan_text not in ("--", ""):
@@ -132,7 +141,7 @@ def parse_port_vlan_settings(html: str) -> list[VlanPortConfig]:
 
         permit_vlans: list[int] = []
         if permit_vlan_text not in ("--", ""):
-            for token in re.split(r"[,_]+", permit_vlan_text):
+            for token in _PERMIT_SEP_RE.split(permit_vlan_text):
                 token = token.strip()
                 if token:
                     with contextlib.suppress(ValueError):
@@ -17,6 +17,8 @@ It does not build JTCom backend ``native_vlan``/``permit_vlans`` state.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from napalm_jtcom.model.vlan import VlanChangeSet, VlanConfig, VlanEntry
 from napalm_jtcom.utils.vlan_membership import apply_vlan_membership_config, port_name_to_id
 
@@ -60,24 +62,21 @@ def plan_vlan_changes(
             creates.append(cfg)
         else:
             entry = current[vid]
+            # A rename alone decides the update; only resolve port names to
+            # IDs for the membership comparison when it is still needed.
             name_changed = cfg.name is not None and cfg.name != entry.name
-
-            current_untagged_ids = _port_names_to_ids(set(entry.untagged_ports))
-            current_tagged_ids = _port_names_to_ids(set(entry.tagged_ports))
-            membership_changed = _membership_changed(
-                current_tagged_ids,
-                current_untagged_ids,
+            if name_changed or _membership_changed(
+                _port_names_to_ids(entry.tagged_ports),
+                _port_names_to_ids(entry.untagged_ports),
                 cfg,
-            )
-
-            if name_changed or membership_changed:
+            ):
                 updates.append(cfg)
 
     return VlanChangeSet(create=creates, update=updates, delete=deletes)
 
 
-def _port_names_to_ids(names: set[str]) -> set[int]:
-    """Convert a set of ``"Port N"`` strings to 1-based port IDs."""
+def _port_names_to_ids(names: Iterable[str]) -> set[int]:
+    """Convert ``"Port N"`` strings to a set of 1-based port IDs."""
     port_ids: set[int] = set()
     for name in names:
         try:
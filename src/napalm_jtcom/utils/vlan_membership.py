@@ -411,15 +411,14 @@ def build_current_per_port_from_jtcom_readback(
             raise ValueError(
                 f"Cannot parse backend port name {backend_port.port_name!r}"
             ) from None
-        backend_mode = backend_port.vlan_type.lower()
-        if backend_mode == "access":
+        if backend_port.mode == "access":
             backend_state: JTComPortVlanState = {
                 "mode": "access",
                 "access_vlan": backend_port.access_vlan,
                 "native_vlan": None,
                 "permit_vlans": [],
             }
-        elif backend_mode == "trunk":
+        elif backend_port.mode == "trunk":
             backend_state = {
                 "mode": "trunk",
                 "access_vlan": None,
@@ -0,0 +1,46 @@
+"""Unit tests for napalm_jtcom.config."""
+
+from __future__ import annotations
+
+import pytest
+
+from napalm_jtcom.config import Settings
+
+
+@pytest.fixture(autouse=True)
+def _clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for suffix in ("HOST", "USERNAME", "PASSWORD", "VERIFY_TLS"):
+        monkeypatch.delenv(f"JTCOM_{suffix}", raising=False)
+
+
+def test_from_env_parses_and_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("JTCOM_HOST", "192.0.2.1")
+    monkeypatch.setenv("JTCOM_USERNAME", "admin")
+    monkeypatch.setenv("JTCOM_PASSWORD", "secret")
+    monkeypatch.setenv("JTCOM_VERIFY_TLS", " Yes ")
+    settings = Settings.from_env()
+    assert settings == Settings("192.0.2.1", "admin", "secret", verify_tls=True)
+    assert Settings.from_env() is settings
+
+
+@pytest.mark.parametrize("raw", ["", "0", "false", "off", "no"])
+def test_from_env_verify_tls_defaults_off(monkeypatch: pytest.MonkeyPatch, raw: str) -> None:
+    monkeypatch.setenv("JTCOM_VERIFY_TLS", raw)
+    settings = Settings.from_env(host="h", username="u", password="p")
+    assert settings.verify_tls is False
+
+
+def test_from_env_rejects_missing_required_variable(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("JTCOM_HOST", "192.0.2.1")
+    with pytest.raises(ValueError, match="JTCOM_USERNAME"):
+        Settings.from_env(password="p")
+
+
+def test_driver_kwargs_merges_optional_args() -> None:
+    settings = Settings("h", "u", "p")
+    assert settings.driver_kwargs(backup_dir="./b") == {
+        "hostname": "h",
+        "username": "u",
+        "password": "p",
+        "optional_args": {"verify_tls": False, "backup_dir": "./b"},
+    }
@@ -237,6 +237,7 @@ def test_port_access_mode() -> None:
     cfg = configs[0]
     assert cfg.port_name == "Port 1"
     assert cfg.vlan_type == "Access"
+    assert cfg.mode == "access"
     assert cfg.access_vlan == 5
     assert cfg.native_vlan is None
     assert cfg.permit_vlans == []
@@ -253,6 +254,7 @@ def test_port_trunk_mode_native_only() -> None:
     html = _PORT_BASED_TEMPLATE.format(rows=rows)
     cfg = parse_port_vlan_settings(html)[0]
     assert cfg.vlan_type == "Trunk"
+    assert cfg.mode == "trunk"
     assert cfg.native_vlan == 10
     assert cfg.access_vlan is None
     assert cfg.permit_vlans == []
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 from unittest.mock import MagicMock
+from urllib.parse import parse_qs
 
 import pytest
 import responses as responses_lib
@@ -170,7 +171,30 @@ class TestApplyPortChanges:
         assert "page=inside" in body
 
     @responses_lib.activate
-    def test_multiple_ports_issue_separate_posts(self) -> None:
+    def test_ports_with_same_settings_share_one_post(self) -> None:
+        responses_lib.add(
+            responses_lib.POST,
+            f"{_BASE}/port.cgi",
+            body=_OK,
+            content_type="application/json",
+        )
+        session = _mock_session()
+        current = [
+            make_settings(1, admin_up=True),
+            make_settings(2, admin_up=True),
+        ]
+        change_set = PortChangeSet(update=[
+            PortConfig(port_id=1, admin_up=False),
+            PortConfig(port_id=2, admin_up=False),
+        ])
+        apply_port_changes(session, current, change_set)
+        assert len(responses_lib.calls) == 1
+        body = parse_qs(responses_lib.calls[0].request.body or "")
+        assert body["portid"] == ["0", "1"]
+        assert body["state"] == ["0"]
+
+    @responses_lib.activate
+    def test_ports_with_different_settings_issue_separate_posts(self) -> None:
         for _ in range(2):
             responses_lib.add(
                 responses_lib.POST,
@@ -185,11 +209,32 @@ class TestApplyPortChanges:
         ]
         change_set = PortChangeSet(update=[
             PortConfig(port_id=1, admin_up=False),
-            PortConfig(port_id=2, admin_up=False),
+            PortConfig(port_id=2, speed_duplex="100M/Full"),
         ])
         apply_port_changes(session, current, change_set)
         assert len(responses_lib.calls) == 2
 
+    @responses_lib.activate
+    def test_batch_disabled_issues_one_post_per_port(self) -> None:
+        for _ in range(2):
+            responses_lib.add(
+                responses_lib.POST,
+                f"{_BASE}/port.cgi",
+                body=_OK,
+                content_type="application/json",
+            )
+        session = _mock_session()
+        current = [
+            make_settings(1, admin_up=True),
+            make_settings(2, admin_up=True),
+        ]
+        change_set = PortChangeSet(update=[
+            PortConfig(port_id=1, admin_up=False),
+            PortConfig(port_id=2, admin_up=False),
+        ])
+        apply_port_changes(session, current, change_set, batch=False)
+        assert len(responses_lib.calls) == 2
+
     @responses_lib.activate
     def test_switch_error_raises(self) -> None:
         responses_lib.add(
@@ -6,10 +6,12 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from napalm_jtcom.client.errors import JTComVerificationError
 from napalm_jtcom.driver import JTComDriver
 from napalm_jtcom.model.config import DeviceConfig
 from napalm_jtcom.model.port import PortConfig, PortSettings
 from napalm_jtcom.model.vlan import VlanConfig, VlanEntry
+from napalm_jtcom.utils.device_diff import Change, DevicePlan
 from napalm_jtcom.utils.port_vlan_input import (
     DualSyntaxConflictError,
     merge_port_vlan_membership_inputs,
@@ -332,3 +334,203 @@ def test_allow_untagged_move_does_not_suppress_dual_syntax_conflict(
                 ports={5: PortConfig(port_id=5, access_vlan=20)},
             )
         )
+
+
+def test_driver_apply_verifies_membership_from_single_post_read(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = JTComDriver(
+        "192.0.2.1", "admin", "admin", optional_args={"backup_before_change": False}
+    )
+    driver._session = MagicMock()
+    ports = [PortSettings(port_id=5, name="Port 5", admin_up=True)]
+    before = {
+        1: VlanEntry(vlan_id=1, name="default", untagged_ports=["Port 5"]),
+        10: VlanEntry(vlan_id=10, name="v10"),
+        20: VlanEntry(vlan_id=20, name="v20", tagged_ports=["Port 5"]),
+    }
+    after = {
+        1: VlanEntry(vlan_id=1, name="default", untagged_ports=["Port 5"]),
+        10: VlanEntry(vlan_id=10, name="v10", tagged_ports=["Port 5"]),
+        20: VlanEntry(vlan_id=20, name="v20", tagged_ports=["Port 5"]),
+    }
+    calls: list[str] = []
+
+    def read(_session: object) -> object:
+        calls.append("state")
+        return before, ports
+
+    def read_vlans(_session: object) -> object:
+        calls.append("vlans")
+        return after
+
+    monkeypatch.setattr(driver, "_read_current_state", read)
+    monkeypatch.setattr(driver, "_fetch_vlan_state", read_vlans)
+
+    result = driver.apply_device_config(
+        DeviceConfig(vlans={10: VlanConfig(vlan_id=10, tagged_add=[5])}),
+    )
+
+    assert result["changed_ports"] == [5]
+    # VLAN-only writes re-read just the VLAN pages, once.
+    assert calls == ["state", "vlans"]
+    driver._session.get_parsed.assert_not_called()
+
+
+def test_driver_apply_of_port_change_rereads_only_port_page(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = JTComDriver(
+        "192.0.2.1", "admin", "admin", optional_args={"backup_before_change": False}
+    )
+    session = MagicMock()
+    driver._session = session
+    vlans = {1: VlanEntry(vlan_id=1, name="default", untagged_ports=["Port 5"])}
+    before = [PortSettings(5, "Port 5", admin_up=True, speed_duplex="Auto", flow_control=False)]
+    after = [PortSettings(5, "Port 5", admin_up=False, speed_duplex="Auto", flow_control=False)]
+    monkeypatch.setattr(driver, "_read_current_state", lambda _session: (vlans, before))
+    monkeypatch.setattr(driver, "_fetch_vlan_state", MagicMock())
+    session.get_parsed.return_value = (after, [])
+
+    result = driver.apply_device_config(
+        DeviceConfig(ports={5: PortConfig(port_id=5, admin_up=False)}),
+    )
+
+    assert result["applied"] == ["port:5"]
+    session.get_parsed.assert_called_once()
+    driver._fetch_vlan_state.assert_not_called()
+    assert driver.last_state == (vlans, after)
+
+
+def test_driver_apply_from_supplied_state_rereads_both_pages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = JTComDriver(
+        "192.0.2.1", "admin", "admin", optional_args={"backup_before_change": False}
+    )
+    driver._session = MagicMock()
+    vlans = {1: VlanEntry(vlan_id=1, name="default", untagged_ports=["Port 5"])}
+    before = [PortSettings(5, "Port 5", admin_up=True, speed_duplex="Auto", flow_control=False)]
+    after = [PortSettings(5, "Port 5", admin_up=False, speed_duplex="Auto", flow_control=False)]
+    read = MagicMock(return_value=(vlans, after))
+    monkeypatch.setattr(driver, "_read_current_state", read)
+
+    result = driver.apply_device_config(
+        DeviceConfig(ports={5: PortConfig(port_id=5, admin_up=False)}),
+        current_state=(vlans, before),
+    )
+
+    assert result["applied"] == ["port:5"]
+    read.assert_called_once()
+    driver._session.get_parsed.assert_not_called()
+
+
+def test_driver_apply_without_writes_rereads_vlan_pages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = JTComDriver(
+        "192.0.2.1", "admin", "admin", optional_args={"backup_before_change": False}
+    )
+    session = MagicMock()
+    driver._session = session
+    state = ({10: VlanEntry(vlan_id=10, name="v10")}, [])
+    no_op_update = Change(kind="vlan_update", key="vlan:10", details={"vlan_id": 10})
+    plans = iter([DevicePlan(changes=[no_op_update]), DevicePlan()])
+    monkeypatch.setattr(driver, "_read_current_state", lambda _session: state)
+    monkeypatch.setattr(driver, "_fetch_vlan_state", MagicMock(return_value=state[0]))
+    monkeypatch.setattr("napalm_jtcom.driver.build_device_plan", lambda *a, **k: next(plans))
+
+    result = driver.apply_device_config(DeviceConfig(vlans={10: VlanConfig(vlan_id=10)}))
+
+    assert result["changed"] is True
+    session.post.assert_not_called()
+    session.get_parsed.assert_not_called()
+    driver._fetch_vlan_state.assert_called_once()
+
+
+def test_driver_apply_without_writes_reports_unapplied_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = JTComDriver(
+        "192.0.2.1", "admin", "admin", optional_args={"backup_before_change": False}
+    )
+    driver._session = MagicMock()
+    state = ({10: VlanEntry(vlan_id=10, name="v10")}, [])
+    update = Change(kind="vlan_update", key="vlan:10", details={"vlan_id": 10})
+    monkeypatch.setattr(driver, "_read_current_state", lambda _session: state)
+    monkeypatch.setattr(driver, "_fetch_vlan_state", lambda _session: state[0])
+    monkeypatch.setattr(
+        "napalm_jtcom.driver.build_device_plan", lambda *a, **k: DevicePlan(changes=[update])
+    )
+
+    with pytest.raises(JTComVerificationError):
+        driver.apply_device_config(DeviceConfig(vlans={10: VlanConfig(vlan_id=10)}))
+
+
+def test_driver_apply_of_current_state_sends_no_writes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = JTComDriver("192.0.2.1", "admin", "admin")
+    session = MagicMock()
+    driver._session = session
+    current_vlans = {
+        1: VlanEntry(vlan_id=1, name="default", untagged_ports=["Port 5"]),
+        10: VlanEntry(vlan_id=10, name="v10", tagged_ports=["Port 5"]),
+    }
+    current_ports = [PortSettings(port_id=5, name="Port 5", admin_up=True)]
+    monkeypatch.setattr(
+        driver,
+        "_read_current_state",
+        lambda _session: (current_vlans, current_ports),
+    )
+
+    result = driver.apply_device_config(
+        DeviceConfig(
+            vlans={10: VlanConfig(vlan_id=10, name="v10")},
+            ports={5: PortConfig(port_id=5, admin_up=True, native_vlan=1, trunk_set_vlans=[10])},
+        ),
+    )
+
+    assert result["changed"] is False
+    assert result["backup_file"] == ""
+    session.post.assert_not_called()
+    session.download_config_backup.assert_not_called()
+
+
+def test_set_methods_plan_from_supplied_current_state() -> None:
+    driver = JTComDriver("192.0.2.1", "admin", "admin")
+    session = MagicMock()
+    driver._session = session
+    current_state = (
+        {10: VlanEntry(vlan_id=10, name="v10", untagged_ports=["Port 5"])},
+        [PortSettings(port_id=5, name="Port 5", admin_up=True)],
+    )
+
+    ports = driver.set_interfaces(
+        [PortConfig(port_id=5, admin_up=False)], dry_run=True, current_state=current_state
+    )
+    vlans = driver.set_vlans(
+        {20: VlanConfig(vlan_id=20, name="v20")}, dry_run=True, current_state=current_state
+    )
+
+    assert ports["updated_ports"] == [5]
+    assert vlans["create"] == [20]
+    assert driver.last_state is None
+    session.get_parsed.assert_not_called()
+
+
+@pytest.mark.parametrize(("optional_args", "ttl"), [({}, 2.0), ({"snapshot_ttl": 0}, 0.0)])
+def test_driver_open_enables_short_page_snapshots_by_default(
+    monkeypatch: pytest.MonkeyPatch,
+    optional_args: dict[str, object],
+    ttl: float,
+) -> None:
+    session_cls = MagicMock()
+    monkeypatch.setattr("napalm_jtcom.driver.JTComSession", session_cls)
+    monkeypatch.delenv("JTCOM_POOL_ENABLED", raising=False)
+    driver = JTComDriver("192.0.2.1", "admin", "admin", optional_args=optional_args)
+
+    driver.open()
+
+    assert session_cls.call_args.kwargs["snapshot_ttl"] == ttl
+    session_cls.return_value.login.assert_called_once()
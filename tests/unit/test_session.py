@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import dataclasses
 import json
+import pathlib
 
 import pytest
 import requests
@@ -21,7 +22,7 @@ from napalm_jtcom.client.errors import (
 )
 from napalm_jtcom.client.http import JTComHTTP, _normalise_base_url
 from napalm_jtcom.client.session import JTComCredentials, JTComSession
-from napalm_jtcom.vendor.jtcom.endpoints import LOGIN, LOGOUT
+from napalm_jtcom.vendor.jtcom.endpoints import CONFIG_BACKUP, LOGIN, LOGOUT
 
 BASE_URL = "http://192.168.1.1"
 CREDS = JTComCredentials(username="admin", password="secret")
@@ -146,6 +147,36 @@ def test_http_user_agent_header_sent() -> None:
     http.close()
 
 
+def test_http_injected_session_is_not_closed(monkeypatch: pytest.MonkeyPatch) -> None:
+    shared = requests.Session()
+    closed: list[bool] = []
+    monkeypatch.setattr(shared, "close", lambda: closed.append(True))
+    http = JTComHTTP(BASE_URL, verify_tls=False, session=shared)
+    http.close()
+    assert closed == []
+
+
+def test_http_own_session_mounts_retrying_pool_adapter() -> None:
+    http = JTComHTTP(BASE_URL, verify_tls=False)
+    adapter = http._session.get_adapter(f"{BASE_URL}/cgi-bin/info.cgi")
+    assert adapter._pool_maxsize == 16
+    assert adapter._pool_block is False
+    assert adapter.max_retries.total == 3
+    assert (adapter.max_retries.read, adapter.max_retries.status) == (2, 2)
+    assert adapter.max_retries.backoff_factor == 0.3
+    assert 503 in adapter.max_retries.status_forcelist
+    assert not adapter.max_retries.is_retry("POST", 503)
+    http.close()
+
+
+def test_http_max_retries_sets_adapter_budget() -> None:
+    http = JTComHTTP(BASE_URL, verify_tls=False, max_retries=0)
+    retry = http._session.get_adapter(f"{BASE_URL}/cgi-bin/info.cgi").max_retries
+    assert (retry.total, retry.connect, retry.read) == (0, 0, 0)
+    assert retry.is_retry("GET", 429)
+    http.close()
+
+
 # ---------------------------------------------------------------------------
 # session.py — JTComCredentials
 # ---------------------------------------------------------------------------
@@ -165,6 +196,28 @@ def test_session_not_logged_in_by_default() -> None:
     assert session.logged_in is False
 
 
+@rsps_lib.activate
+def test_session_reuses_one_pooled_http_session_across_requests() -> None:
+    rsps_lib.add(
+        rsps_lib.POST,
+        f"{BASE_URL}{LOGIN}",
+        body=_json({"code": CODE_OK, "data": ""}),
+        status=200,
+    )
+    rsps_lib.add(rsps_lib.GET, f"{BASE_URL}/port.cgi", body="<html/>", status=200)
+    session = _make_session()
+    http_session = session._http._session
+    adapter = http_session.get_adapter(f"{BASE_URL}/port.cgi")
+
+    session.get("/port.cgi")
+    session.get("/port.cgi")
+
+    assert session._http._session is http_session
+    assert http_session.get_adapter(f"{BASE_URL}/port.cgi") is adapter
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 3
+
+
 def test_session_base_url_normalised() -> None:
     session = JTComSession(base_url="192.168.1.1/", credentials=CREDS)
     assert session._http.base_url == "http://192.168.1.1"
@@ -210,7 +263,7 @@ def test_login_non_json_raises_parse_error() -> None:
         status=200,
     )
     session = _make_session()
-    with pytest.raises(JTComParseError):
+    with pytest.raises(JTComParseError, match="'<html>error</html>'"):
         session.login()
 
 
@@ -267,6 +320,8 @@ def test_get_injects_page_and_stamp(monkeypatch: pytest.MonkeyPatch) -> None:
     get_call = rsps_lib.calls[1]
     assert "page=inside" in get_call.request.url
     assert "stamp=1700000000" in get_call.request.url
+    session.get("/cgi-bin/vlan_static.cgi")
+    assert "stamp=1700000001" in rsps_lib.calls[2].request.url
 
 
 @rsps_lib.activate
@@ -291,6 +346,122 @@ def test_get_passes_extra_params(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "vid=10" in get_call.request.url
 
 
+@rsps_lib.activate
+def test_download_config_backup_injects_page_and_stamp(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("napalm_jtcom.client.session.time.time", lambda: 1700000000.0)
+    rsps_lib.add(
+        rsps_lib.POST,
+        f"{BASE_URL}{LOGIN}",
+        body=_json({"code": CODE_OK, "data": ""}),
+        status=200,
+    )
+    rsps_lib.add(rsps_lib.GET, f"{BASE_URL}{CONFIG_BACKUP}", body=b"\x00cfg", status=200)
+    session = _make_session()
+
+    assert session.download_config_backup() == b"\x00cfg"
+    url = rsps_lib.calls[1].request.url
+    assert "cmd=conf_backup" in url
+    assert "page=inside" in url
+    assert "stamp=1700000000" in url
+
+
+@rsps_lib.activate
+def test_download_config_backup_to_streams_into_file(tmp_path: pathlib.Path) -> None:
+    rsps_lib.add(
+        rsps_lib.POST,
+        f"{BASE_URL}{LOGIN}",
+        body=_json({"code": CODE_OK, "data": ""}),
+        status=200,
+    )
+    rsps_lib.add(rsps_lib.GET, f"{BASE_URL}{CONFIG_BACKUP}", body=b"\x00cfg" * 1000, status=200)
+    session = _make_session()
+    target = tmp_path / "backup.bin"
+
+    assert session.download_config_backup_to(target) == 4000
+    assert target.read_bytes() == b"\x00cfg" * 1000
+    assert "cmd=conf_backup" in rsps_lib.calls[1].request.url
+
+
+@rsps_lib.activate
+def test_download_config_backup_to_keeps_target_on_mid_stream_failure(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rsps_lib.add(
+        rsps_lib.POST,
+        f"{BASE_URL}{LOGIN}",
+        body=_json({"code": CODE_OK, "data": ""}),
+        status=200,
+    )
+    rsps_lib.add(rsps_lib.GET, f"{BASE_URL}{CONFIG_BACKUP}", body=b"\x00cfg" * 1000, status=200)
+
+    def _broken_iter_content(self: requests.Response, chunk_size: int = 1) -> object:
+        yield b"\x00cfg"
+        raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+    session = _make_session()
+    session.login()
+    monkeypatch.setattr(requests.Response, "iter_content", _broken_iter_content)
+    target = tmp_path / "backup.bin"
+    target.write_bytes(b"previous")
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        session.download_config_backup_to(target)
+    assert target.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_http_get_stream_closes_response_on_error_status() -> None:
+    resp = requests.Response()
+    resp.status_code = 500
+    resp.url = f"{BASE_URL}{CONFIG_BACKUP}"
+    closed: list[bool] = []
+    resp.close = lambda: closed.append(True)  # type: ignore[method-assign]
+    http = JTComHTTP(BASE_URL)
+    http._session.get = lambda *args, **kwargs: resp  # type: ignore[method-assign]
+
+    with pytest.raises(JTComResponseError):
+        http.get(CONFIG_BACKUP, stream=True)
+    assert closed == [True]
+
+
+@rsps_lib.activate
+def test_get_parsed_reuses_snapshot_until_post() -> None:
+    rsps_lib.add(
+        rsps_lib.POST,
+        f"{BASE_URL}{LOGIN}",
+        body=_json({"code": CODE_OK, "data": ""}),
+        status=200,
+    )
+    rsps_lib.add(rsps_lib.GET, f"{BASE_URL}/port.cgi", body="<html/>", status=200)
+    rsps_lib.add(
+        rsps_lib.POST,
+        f"{BASE_URL}/port.cgi",
+        body=_json({"code": CODE_OK, "data": ""}),
+        status=200,
+    )
+    session = JTComSession(
+        base_url=BASE_URL, credentials=CREDS, verify_tls=False, snapshot_ttl=60.0
+    )
+    parsed: list[str] = []
+
+    def parser(html: str) -> list[str]:
+        parsed.append(html)
+        return [html]
+
+    first = session.get_parsed("/port.cgi", parser)
+    assert session.get_parsed("/port.cgi", parser) is first
+    assert session.get("/port.cgi") == "<html/>"
+    assert len(parsed) == 1
+
+    session.post("/port.cgi", data={"portid": "0"})
+    session.get_parsed("/port.cgi", parser)
+    get_calls = [c for c in rsps_lib.calls if c.request.method == "GET"]
+    assert len(get_calls) == 2
+    assert len(parsed) == 2
+
+
 # ---------------------------------------------------------------------------
 # session.py — POST JSON parse + retry on code=11
 # ---------------------------------------------------------------------------
@@ -336,6 +507,26 @@ def test_post_injects_page_inside() -> None:
     assert "page=inside" in vlan_call.request.body
 
 
+@rsps_lib.activate
+def test_post_keeps_repeated_keys_from_any_pair_sequence() -> None:
+    rsps_lib.add(
+        rsps_lib.POST,
+        f"{BASE_URL}{LOGIN}",
+        body=_json({"code": CODE_OK, "data": ""}),
+        status=200,
+    )
+    rsps_lib.add(
+        rsps_lib.POST,
+        f"{BASE_URL}/cgi-bin/vlan_static.cgi",
+        body=_json({"code": CODE_OK, "data": ""}),
+        status=200,
+    )
+    session = _make_session()
+    session.post("/cgi-bin/vlan_static.cgi", data=(("del", "10"), ("del", "20")))
+
+    assert rsps_lib.calls[1].request.body == "page=inside&del=10&del=20"
+
+
 @rsps_lib.activate
 def test_post_retry_on_auth_expiry() -> None:
     """On code=11 the session re-logs in and retries exactly once."""
@@ -0,0 +1,115 @@
+"""Unit tests for napalm_jtcom.client.pool."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from napalm_jtcom.client.errors import JTComAuthError
+from napalm_jtcom.client.pool import SessionPool, pool_enabled
+from napalm_jtcom.driver import JTComDriver
+
+
+def _factory(created: list[MagicMock]) -> MagicMock:
+    session = MagicMock(logged_in=True)
+    created.append(session)
+    return session
+
+
+def test_pool_reuses_released_session() -> None:
+    pool = SessionPool()
+    created: list[MagicMock] = []
+    first = pool.acquire("k", lambda: _factory(created))
+    pool.release("k", first)
+    second = pool.acquire("k", lambda: _factory(created))
+    assert second is first
+    assert len(created) == 1
+    first.close.assert_not_called()
+    pool.close_all()
+    first.close.assert_called_once()
+
+
+def test_pool_hands_busy_key_a_fresh_session_closed_on_release() -> None:
+    pool = SessionPool()
+    created: list[MagicMock] = []
+    first = pool.acquire("k", lambda: _factory(created))
+    overflow = pool.acquire("k", lambda: _factory(created))
+    assert overflow is not first
+    pool.release("k", overflow)
+    overflow.close.assert_called_once()
+    pool.close_all()
+
+
+def test_pool_replaces_logged_out_session() -> None:
+    pool = SessionPool()
+    created: list[MagicMock] = []
+    first = pool.acquire("k", lambda: _factory(created))
+    pool.release("k", first)
+    first.logged_in = False
+    second = pool.acquire("k", lambda: _factory(created))
+    assert second is not first
+    first.close.assert_called_once()
+    pool.close_all()
+
+
+def test_pool_replaces_session_that_fails_validation_once() -> None:
+    pool = SessionPool()
+    created: list[MagicMock] = []
+    first = pool.acquire("k", lambda: _factory(created))
+    pool.release("k", first)
+    validate = MagicMock(side_effect=JTComAuthError("expired"))
+
+    second = pool.acquire("k", lambda: _factory(created), validate=validate)
+
+    assert second is not first
+    validate.assert_called_once_with(first)
+    first.close.assert_called_once()
+    pool.release("k", second)
+    assert pool.acquire("k", lambda: _factory(created)) is second
+    pool.close_all()
+
+
+def test_pool_validates_reused_session() -> None:
+    pool = SessionPool()
+    created: list[MagicMock] = []
+    first = pool.acquire("k", lambda: _factory(created))
+    pool.release("k", first)
+    validate = MagicMock()
+
+    assert pool.acquire("k", lambda: _factory(created), validate=validate) is first
+    validate.assert_called_once_with(first)
+    pool.close_all()
+
+
+def test_pool_prunes_idle_sessions() -> None:
+    pool = SessionPool(idle_timeout=0.0)
+    created: list[MagicMock] = []
+    session = pool.acquire("k", lambda: _factory(created))
+    pool.release("k", session)
+    assert pool.prune() == 1
+    session.close.assert_called_once()
+    pool.close_all()
+
+
+def test_pool_enabled_reads_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("JTCOM_POOL_ENABLED", raising=False)
+    assert pool_enabled() is False
+    monkeypatch.setenv("JTCOM_POOL_ENABLED", "1")
+    assert pool_enabled() is True
+
+
+def test_driver_pool_key_separates_tls_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("JTCOM_POOL_ENABLED", "1")
+    monkeypatch.setattr("napalm_jtcom.driver.JTComSession", MagicMock())
+    pool = MagicMock()
+    monkeypatch.setattr("napalm_jtcom.driver.default_pool", lambda: pool)
+    keys = []
+    for verify_tls in (False, True):
+        driver = JTComDriver(
+            "192.0.2.1", "admin", "admin", optional_args={"verify_tls": verify_tls, "port": 80}
+        )
+        driver.open()
+        keys.append(pool.acquire.call_args.args[0])
+
+    assert keys[0] != keys[1]
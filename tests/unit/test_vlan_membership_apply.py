@@ -10,8 +10,9 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from napalm_jtcom.client.errors import JTComVerificationError
+from napalm_jtcom.client.errors import JTComError, JTComVerificationError
 from napalm_jtcom.driver import JTComDriver
+from napalm_jtcom.model.config import DeviceConfig
 from napalm_jtcom.model.port import PortSettings
 from napalm_jtcom.model.vlan import VlanConfig, VlanEntry, VlanPortConfig
 from napalm_jtcom.utils.vlan_membership import (
@@ -240,6 +241,69 @@ def test_driver_apply_uses_shared_canonical_to_jtcom_compiler(
     assert payload["PermitVlan"] == "1_61"
 
 
+def test_driver_apply_batches_ports_with_identical_backend_state() -> None:
+    driver = JTComDriver("192.0.2.1", "admin", "admin")
+    session = MagicMock()
+    plan = VlanMembershipPlan(
+        current_per_port={port_id: make_port_state(untagged_vlan=1) for port_id in (1, 2, 3)},
+        desired_per_port={
+            1: make_port_state(untagged_vlan=20),
+            2: make_port_state(untagged_vlan=30),
+            3: make_port_state(untagged_vlan=20),
+        },
+        changed_ports=[1, 2, 3],
+        changed_vlans=[20, 30],
+        warnings=[],
+    )
+
+    driver._apply_vlan_membership_plan(session, plan)
+
+    payloads = [c.kwargs["data"] for c in session.post.call_args_list]
+    assert [(p["PortId"], p["AccessVlan"]) for p in payloads] == [("0_2", "20"), ("1", "30")]
+
+
+def test_driver_apply_writes_per_port_when_batching_disabled() -> None:
+    driver = JTComDriver(
+        "192.0.2.1", "admin", "admin", optional_args={"batch_commands": False}
+    )
+    session = MagicMock()
+    plan = VlanMembershipPlan(
+        current_per_port={port_id: make_port_state(untagged_vlan=1) for port_id in (1, 3)},
+        desired_per_port={port_id: make_port_state(untagged_vlan=20) for port_id in (1, 3)},
+        changed_ports=[1, 3],
+        changed_vlans=[20],
+        warnings=[],
+    )
+
+    driver._apply_vlan_membership_plan(session, plan)
+
+    assert [c.kwargs["data"]["PortId"] for c in session.post.call_args_list] == ["0", "2"]
+
+
+def test_driver_apply_posts_membership_groups_concurrently_when_enabled() -> None:
+    driver = JTComDriver(
+        "192.0.2.1", "admin", "admin", optional_args={"max_parallel_writes": 4}
+    )
+    session = MagicMock()
+    plan = VlanMembershipPlan(
+        current_per_port={port_id: make_port_state(untagged_vlan=1) for port_id in (1, 2, 3)},
+        desired_per_port={
+            1: make_port_state(untagged_vlan=20),
+            2: make_port_state(untagged_vlan=30),
+            3: make_port_state(untagged_vlan=40),
+        },
+        changed_ports=[1, 2, 3],
+        changed_vlans=[20, 30, 40],
+        warnings=[],
+    )
+
+    driver._apply_vlan_membership_plan(session, plan)
+
+    session.ensure_session.assert_called_once()
+    sent = sorted((c.args[0], c.args[1]["PortId"]) for c in session.post.call_args_list)
+    assert sent == [("/vlanport.cgi", "0"), ("/vlanport.cgi", "1"), ("/vlanport.cgi", "2")]
+
+
 def test_apply_boundary_rejects_tagged_only_canonical_state_clearly() -> None:
     driver = JTComDriver("192.0.2.1", "admin", "admin")
 
@@ -321,10 +385,14 @@ def test_real_world_trunk_playbook_scenario_stays_canonical_until_apply() -> Non
         }
 
 
+@pytest.mark.parametrize("parallel_reads", [False, True])
 def test_fetch_vlan_state_materializes_canonical_membership_from_jtcom_readback(
     monkeypatch: pytest.MonkeyPatch,
+    parallel_reads: bool,
 ) -> None:
-    driver = JTComDriver("192.0.2.1", "admin", "admin")
+    driver = JTComDriver(
+        "192.0.2.1", "admin", "admin", optional_args={"parallel_reads": parallel_reads}
+    )
     session = MagicMock()
 
     monkeypatch.setattr(
@@ -345,7 +413,7 @@ def test_fetch_vlan_state_materializes_canonical_membership_from_jtcom_readback(
             )
         ],
     )
-    session.get.side_effect = ["static_html", "port_html"]
+    session.get_parsed.side_effect = lambda path, parser, params=None: parser(path)
 
     vlan_map = driver._fetch_vlan_state(session)
 
@@ -355,6 +423,35 @@ def test_fetch_vlan_state_materializes_canonical_membership_from_jtcom_readback(
     assert vlan_map[61].tagged_ports == ["Port 1"]
 
 
+@pytest.mark.parametrize("parallel_reads", [False, True])
+def test_read_current_state_reads_vlan_and_port_pages(
+    monkeypatch: pytest.MonkeyPatch,
+    parallel_reads: bool,
+) -> None:
+    driver = JTComDriver(
+        "192.0.2.1", "admin", "admin", optional_args={"parallel_reads": parallel_reads}
+    )
+    session = MagicMock()
+    ports = [PortSettings(port_id=1, name="Port 1", admin_up=True)]
+    monkeypatch.setattr(
+        "napalm_jtcom.driver.parse_static_vlans",
+        lambda _html: [VlanEntry(vlan_id=1, name="default")],
+    )
+    monkeypatch.setattr(
+        "napalm_jtcom.driver.parse_port_vlan_settings",
+        lambda _html: [VlanPortConfig(port_name="Port 1", vlan_type="Access", access_vlan=1)],
+    )
+    monkeypatch.setattr("napalm_jtcom.driver.parse_port_page", lambda _html: (ports, []))
+    session.get_parsed.side_effect = lambda path, parser, params=None: parser(path)
+
+    vlan_map, settings_list = driver._read_current_state(session)
+
+    assert vlan_map[1].untagged_ports == ["Port 1"]
+    assert settings_list is ports
+    assert session.get_parsed.call_count == 3
+    assert driver.last_state == (vlan_map, ports)
+
+
 def test_build_current_rejects_port_untagged_in_multiple_vlans() -> None:
     current_vlans = {
         10: VlanEntry(vlan_id=10, name="v10", untagged_ports=["Port 1"]),
@@ -439,6 +536,66 @@ def test_set_vlans_mode_none_maps_to_vlan1_before_apply(
     session.download_config_backup.assert_not_called()
 
 
+def test_set_vlans_without_changes_skips_backup_and_writes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = JTComDriver("192.0.2.1", "admin", "admin")
+    session = MagicMock()
+    driver._session = session
+    current_vlans = {
+        20: VlanEntry(vlan_id=20, name="v20", untagged_ports=["Port 4"]),
+    }
+    current_ports = [PortSettings(port_id=4, name="Port 4", admin_up=True)]
+    monkeypatch.setattr(
+        driver,
+        "_read_current_state",
+        lambda _session: (current_vlans, current_ports),
+    )
+
+    result = driver.set_vlans({20: VlanConfig(vlan_id=20, name="v20", untagged_add=[4])})
+
+    assert (result["create"], result["update"], result["delete"]) == ([], [], [])
+    assert result["changed_ports"] == []
+    session.download_config_backup_to.assert_not_called()
+    session.post.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("hostname", "safe_host"),
+    [
+        ("192.0.2.1", "192.0.2.1"),
+        ("http://192.0.2.1:8080", "http_192.0.2.1_8080"),
+        ("fe80::1", "fe80__1"),
+        ("https://sw//a", "https_sw__a"),
+    ],
+)
+def test_driver_backup_host_name_replaces_each_separator(hostname: str, safe_host: str) -> None:
+    driver = JTComDriver(hostname, "admin", "admin")
+
+    assert driver._safe_host == safe_host
+
+
+def test_driver_apply_stops_before_writes_when_backup_cannot_be_saved(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    session = MagicMock()
+    session.download_config_backup_to.side_effect = OSError("No space left")
+    before = ({10: VlanEntry(vlan_id=10, name="old")}, [])
+    driver = JTComDriver(
+        "192.0.2.1", "admin", "admin", optional_args={"backup_dir": str(tmp_path)}
+    )
+    driver._session = session
+    monkeypatch.setattr(driver, "_read_current_state", lambda _session: before)
+
+    with pytest.raises(JTComError, match="No space left"):
+        driver.apply_device_config(
+            DeviceConfig(vlans={10: VlanConfig(vlan_id=10, name="new")}),
+        )
+
+    session.post.assert_not_called()
+
+
 def test_untagged_move_apply_fails_by_default() -> None:
     current = {3: make_port_state(untagged_vlan=20)}
     with pytest.raises(VlanMembershipUntaggedMoveError) as exc_info:
@@ -750,6 +907,20 @@ def test_action_plugin_int_list_helper_preserves_missing_none_and_empty_list(
     assert module._int_or_none({"access_vlan": "10"}, "access_vlan") == 10
 
 
+@pytest.mark.parametrize(
+    "path",
+    [
+        pathlib.Path("ansible/action_plugins/jtcom_config.py"),
+        pathlib.Path("galaxy/bronweg/cgiswitch/plugins/action/jtcom_config.py"),
+    ],
+)
+def test_action_plugin_int_keyed_accepts_int_and_str_keys(path: pathlib.Path) -> None:
+    module = _load_action_plugin_module(path)
+
+    assert list(module._int_keyed({10: "a", "20": "b"})) == [(10, "a"), (20, "b")]
+    assert list(module._int_keyed(None)) == []
+
+
 @pytest.mark.parametrize(
     ("path", "verify_tls_default"),
     [
@@ -776,7 +947,7 @@ def test_action_plugin_passes_allow_vlan_delete_in_use_only_when_present(
             captured["hostname"] = hostname
             captured["username"] = username
             captured["password"] = password
-            captured["optional_args"] = dict(optional_args)
+            captured["optional_args"] = optional_args
 
         def open(self) -> None:
             pass
@@ -823,6 +994,7 @@ def test_action_plugin_passes_allow_vlan_delete_in_use_only_when_present(
         "safety_port_id": 6,
         "allow_port_mode_change": False,
         "allow_untagged_move": False,
+        "batch_commands": True,
         "allow_vlan_delete_in_use": True,
     }
 
@@ -853,7 +1025,7 @@ def test_action_plugin_does_not_inject_allow_vlan_delete_in_use_when_absent(
             captured["hostname"] = hostname
             captured["username"] = username
             captured["password"] = password
-            captured["optional_args"] = dict(optional_args)
+            captured["optional_args"] = optional_args
 
         def open(self) -> None:
             pass
@@ -898,9 +1070,28 @@ def test_action_plugin_does_not_inject_allow_vlan_delete_in_use_when_absent(
         "safety_port_id": 6,
         "allow_port_mode_change": False,
         "allow_untagged_move": False,
+        "batch_commands": True,
     }
 
 
+@pytest.mark.parametrize(
+    "path",
+    [
+        pathlib.Path("ansible/action_plugins/jtcom_config.py"),
+        pathlib.Path("galaxy/bronweg/cgiswitch/plugins/action/jtcom_config.py"),
+    ],
+)
+def test_action_plugin_reports_all_missing_required_params(path: pathlib.Path) -> None:
+    module = _load_action_plugin_module(path)
+    action = module.ActionModule()
+    action._task = types.SimpleNamespace(args={"host": "192.0.2.1"})
+    action._play_context = types.SimpleNamespace(check_mode=False)
+
+    result = action.run()
+
+    assert result == {"failed": True, "msg": "Missing required parameters: username, password."}
+
+
 def _load_action_plugin_module(path: pathlib.Path) -> types.ModuleType:
     class ActionBase:
         def run(
@@ -946,6 +1137,8 @@ def _load_action_plugin_module(path: pathlib.Path) -> types.ModuleType:
         assert spec is not None
         assert spec.loader is not None
         module = importlib.util.module_from_spec(spec)
+        # Ansible's plugin loader registers the module before executing it.
+        sys.modules[spec.name] = module
         spec.loader.exec_module(module)
         return module
     finally:
@@ -9,12 +9,21 @@ from __future__ import annotations
 
 import json
 from unittest.mock import MagicMock
+from urllib.parse import parse_qs
 
 import pytest
 import responses as responses_lib
 
+from napalm_jtcom.client import batch as batch_module
+from napalm_jtcom.client.batch import submit_batch
 from napalm_jtcom.client.errors import JTComSwitchError
-from napalm_jtcom.client.vlan_ops import vlan_create, vlan_delete, vlan_set_port
+from napalm_jtcom.client.http import POOL_MAXSIZE
+from napalm_jtcom.client.vlan_ops import (
+    vlan_create,
+    vlan_create_form,
+    vlan_delete,
+    vlan_set_port,
+)
 
 _BASE = "http://192.168.1.1"
 _OK = json.dumps({"code": 0, "data": ""})
@@ -126,6 +135,20 @@ class TestVlanDelete:
         assert "del=20" in body
         assert "del=30" in body
 
+    @responses_lib.activate
+    def test_delete_sends_each_vlan_once_in_order(self) -> None:
+        responses_lib.add(
+            responses_lib.POST,
+            f"{_BASE}/staticvlan.cgi",
+            body=_OK,
+            content_type="application/json",
+        )
+        session = _mock_session()
+        vlan_delete(session, [30, 10, 30, 1])
+
+        body = parse_qs(responses_lib.calls[0].request.body or "")
+        assert body["del"] == ["10", "30"]
+
     def test_delete_vlan1_raises_value_error(self) -> None:
         session = _mock_session()
         with pytest.raises(ValueError, match="deletable"):
@@ -245,3 +268,56 @@ class TestVlanSetPort:
         req = responses_lib.calls[0].request
         body = req.body or ""
         assert "VlanType=1" in body
+
+
+# ---------------------------------------------------------------------------
+# submit_batch
+# ---------------------------------------------------------------------------
+
+class TestSubmitBatch:
+    @pytest.mark.parametrize("max_parallel", [1, 4])
+    @responses_lib.activate
+    def test_batch_posts_every_form(self, max_parallel: int) -> None:
+        responses_lib.add(
+            responses_lib.POST,
+            f"{_BASE}/staticvlan.cgi",
+            body=_OK,
+            content_type="application/json",
+        )
+        session = _mock_session()
+        forms = [vlan_create_form(vid, f"v{vid}") for vid in (10, 20, 30)]
+        results = submit_batch(session, "/staticvlan.cgi", forms, max_parallel=max_parallel)
+
+        assert results == [{"code": 0, "data": ""}] * 3
+        bodies = [parse_qs(call.request.body or "") for call in responses_lib.calls]
+        vids = sorted(body["vlanid"][0] for body in bodies)
+        assert vids == ["10", "20", "30"]
+
+    @responses_lib.activate
+    def test_batch_raises_switch_error(self) -> None:
+        responses_lib.add(
+            responses_lib.POST,
+            f"{_BASE}/staticvlan.cgi",
+            body=_ERR,
+            content_type="application/json",
+        )
+        session = _mock_session()
+        with pytest.raises(JTComSwitchError):
+            submit_batch(session, "/staticvlan.cgi", [vlan_create_form(10)] * 2, max_parallel=2)
+
+    def test_batch_workers_capped_at_pool_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        seen: list[int] = []
+        real_executor = batch_module.ThreadPoolExecutor
+
+        def recording_executor(max_workers: int, **kwargs: object) -> object:
+            seen.append(max_workers)
+            return real_executor(max_workers=max_workers, **kwargs)
+
+        monkeypatch.setattr(batch_module, "ThreadPoolExecutor", recording_executor)
+        session = MagicMock()
+        forms = [vlan_create_form(vid) for vid in range(2, 2 + POOL_MAXSIZE * 2)]
+
+        submit_batch(session, "/staticvlan.cgi", forms, max_parallel=1000)
+
+        assert seen == [POOL_MAXSIZE]
+        assert session.post.call_count == len(forms)